@@ -6,6 +6,14 @@ A Python package for managing user feedback and interactions.
 
 __version__ = "0.1.0"
 
-from .gum import gum
-
 __all__ = ["gum"]
+
+
+def __getattr__(name):
+    # Resolved lazily so importing the CLI (e.g. for ``--help``) does not
+    # pull in SQLAlchemy and the observer stack.
+    if name == "gum":
+        from .gum import gum
+
+        return gum
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -4,14 +4,20 @@ from .google_drive import (
     USE_GDRIVE,
     initialize_google_drive,
     _generate_client_secrets_from_env,
+    _has_fresh_credentials,
     find_folder_by_name,
+    get_drive,
     upload_file,
+    upload_files,
 )
 
 __all__ = [
     "USE_GDRIVE",
     "initialize_google_drive",
     "_generate_client_secrets_from_env",
+    "_has_fresh_credentials",
     "find_folder_by_name",
+    "get_drive",
     "upload_file",
+    "upload_files",
 ]
@@ -1,7 +1,14 @@
 from __future__ import annotations
 
+import calendar
+import fcntl
+import functools
 import json
 import os
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING
 
 try:
@@ -18,6 +25,34 @@ if TYPE_CHECKING:  # pragma: no cover
     from pydrive.drive import GoogleDrive as _GoogleDrive
 
 
+# A cached access token only counts as fresh if it stays valid for at least
+# this long, so we never hand out one about to expire.
+_TOKEN_MIN_REMAINING_SEC = 5 * 60
+
+# How oauth2client serializes ``token_expiry`` (always UTC).
+_TOKEN_EXPIRY_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+
+# Set once client_secrets.json is known to exist, so repeat calls skip the
+# filesystem checks and .env parsing.
+_secrets_ready: bool = False
+
+_REQUIRED_ENV_VARS = ("GOOGLE_CLIENT_ID", "GOOGLE_PROJECT_ID", "GOOGLE_CLIENT_SECRET")
+
+# KEY=VALUE lines of a .env file, used when python-dotenv is unavailable.
+_ENV_RE = re.compile(rb"^[ \t]*([A-Za-z_][A-Za-z0-9_]*)[ \t]*=[ \t]*(.*?)[ \t\r]*$", re.M)
+
+_FOLDER_BY_TITLE_Q = (
+    "mimeType='application/vnd.google-apps.folder' and title='{title}' and trashed=false"
+)
+
+# Folder IDs resolved by find_folder_by_name, keyed by (folder name, client).
+# A folder's ID never changes, so one lookup per session is enough.
+_folder_ids: dict[tuple[str, int], str] = {}
+
+# Authorized Http objects of the calling thread, keyed by id(drive client).
+_thread_http = threading.local()
+
+
 def _require_pydrive() -> None:
     if not USE_GDRIVE:
         raise RuntimeError(
@@ -32,29 +67,41 @@ def _generate_client_secrets_from_env() -> bool:
     Returns True if generated successfully or if file already exists.
     Returns False if .env is missing or incomplete.
     """
+    global _secrets_ready
+    if _secrets_ready:
+        return True
+
     client_secrets_path = "config/.google_auth/client_secrets.json"
 
     # If client_secrets.json already exists, no need to generate
-    if os.path.exists(client_secrets_path):
+    try:
+        os.stat(client_secrets_path)
+    except FileNotFoundError:
+        pass
+    else:
+        _secrets_ready = True
         return True
 
-    # Check if .env file exists in config/
-    env_file = "config/.env"
-    if not os.path.exists(env_file):
-        return False
-
-    # Try to load environment variables from .env
-    try:
-        from dotenv import load_dotenv
-        load_dotenv(env_file)
-    except ImportError:
-        # python-dotenv not installed, try reading manually
-        with open(env_file, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#') and '=' in line:
-                    key, value = line.split('=', 1)
-                    os.environ[key.strip()] = value.strip()
+    # Credentials injected by the environment (CI, containers) need no .env
+    if not all(key in os.environ for key in _REQUIRED_ENV_VARS):
+        # Check if .env file exists in config/
+        env_file = "config/.env"
+        try:
+            os.stat(env_file)
+        except FileNotFoundError:
+            return False
+
+        # Try to load environment variables from .env
+        try:
+            from dotenv import load_dotenv
+            load_dotenv(env_file)
+        except ImportError:
+            # python-dotenv not installed, try reading manually
+            with open(env_file, 'rb') as f:
+                data = f.read()
+            os.environ.update(
+                (key.decode(), value.decode()) for key, value in _ENV_RE.findall(data)
+            )
 
     # Read required environment variables
     client_id = os.getenv("GOOGLE_CLIENT_ID")
@@ -81,13 +128,47 @@ def _generate_client_secrets_from_env() -> bool:
     # Create output directory if it doesn't exist
     os.makedirs("config/.google_auth", exist_ok=True)
 
-    # Write the JSON file
-    with open(client_secrets_path, "w") as f:
-        json.dump(client_secrets, f, indent=2)
+    # Serialize concurrent launches and write atomically so a crash or a
+    # racing process never leaves a truncated client_secrets.json behind.
+    with open("config/.google_auth/.lock", "w") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        # Another process may have written the file while we waited
+        if not os.path.exists(client_secrets_path):
+            tmp_path = client_secrets_path + ".tmp"
+            with open(tmp_path, "w") as f:
+                f.write(json.dumps(client_secrets, indent=2))
+            os.replace(tmp_path, client_secrets_path)
 
+    _secrets_ready = True
     return True
 
 
+def _has_fresh_credentials(
+    credentials_file: str = "config/.google_auth/credentials.json",
+) -> bool:
+    """
+    Return True if the cached OAuth access token is still valid.
+
+    Reads the ``token_expiry`` that oauth2client stores with the credentials.
+    The file's mtime is no use here: ``initialize_google_drive`` re-saves the
+    credentials on every run, whether or not the token was refreshed.
+    """
+    try:
+        with open(credentials_file, "rb") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return False
+
+    expiry = data.get("token_expiry")
+    if not expiry or data.get("invalid"):
+        return False
+    try:
+        expires_at = calendar.timegm(time.strptime(expiry, _TOKEN_EXPIRY_FORMAT))
+    except (TypeError, ValueError):
+        return False
+    return expires_at - time.time() >= _TOKEN_MIN_REMAINING_SEC
+
+
 def initialize_google_drive(client_secrets_path: str | None = None) -> "GoogleDrive":
     """
     Initialize Google Drive authentication with optional custom client_secrets.json path.
@@ -124,10 +205,12 @@ def initialize_google_drive(client_secrets_path: str | None = None) -> "GoogleDr
         client_secrets_path = os.path.abspath(os.path.expanduser(client_secrets_path))
 
         # Verify the file exists
-        if not os.path.exists(client_secrets_path):
+        try:
+            os.stat(client_secrets_path)
+        except FileNotFoundError:
             raise FileNotFoundError(
                 f"Client secrets file not found: {client_secrets_path}"
-            )
+            ) from None
 
         # Set the client secrets file path
         gauth.settings['client_config_file'] = client_secrets_path
@@ -154,19 +237,49 @@ def initialize_google_drive(client_secrets_path: str | None = None) -> "GoogleDr
     return GoogleDrive(gauth)
 
 
+@functools.lru_cache(maxsize=1)
+def get_drive(client_secrets_path: str | None = None) -> "GoogleDrive":
+    """
+    Return a process-wide authenticated Google Drive client.
+
+    Authentication happens on the first call only; later calls reuse the same
+    client. Failed attempts are not cached, so a later call retries.
+    """
+    return initialize_google_drive(client_secrets_path)
+
+
 def find_folder_by_name(folder_name: str, drive: "_GoogleDrive"):
     """Find a folder by name and return its ID"""
     _require_pydrive()
-    folders = drive.ListFile(
-        {
-            "q": f"mimeType='application/vnd.google-apps.folder' and title='{folder_name}' and trashed=false"
-        }
-    ).GetList()
+    key = (folder_name, id(drive))
+    folder_id = _folder_ids.get(key)
+    if folder_id is not None:
+        return folder_id
+    # Escape backslashes and quotes so the name can't break out of the literal
+    title = folder_name.replace("\\", "\\\\").replace("'", "\\'")
+    folders = drive.ListFile({"q": _FOLDER_BY_TITLE_Q.format(title=title)}).GetList()
     if folders:
-        return folders[0]["id"]
+        folder_id = _folder_ids[key] = folders[0]["id"]
+        return folder_id
     return None
 
 
+def _http_for_thread(drive_instance: "_GoogleDrive"):
+    """Return the calling thread's authorized Http for *drive_instance*.
+
+    Without an explicit Http, PyDrive builds a fresh one (and a fresh TLS
+    connection) for every request; an Http must not be shared between
+    threads, so each thread keeps and reuses its own.
+    """
+    by_client = getattr(_thread_http, "by_client", None)
+    if by_client is None:
+        by_client = _thread_http.by_client = {}
+    http = by_client.get(id(drive_instance))
+    if http is None:
+        http = by_client[id(drive_instance)] = drive_instance.auth.Get_Http_Object()
+    return http
+
+
 def upload_file(
     path: str,
     drive_dir: str,
@@ -176,6 +289,9 @@ def upload_file(
 ):
     """Upload a file to Google Drive and optionally delete the local file.
 
+    Safe to call from several threads at once; each thread uploads through
+    its own authorized connection.
+
     Parameters
     ----------
     path : str
@@ -189,9 +305,58 @@ def upload_file(
     """
     _require_pydrive()
     upload_file = drive_instance.CreateFile(
-        {"title": path.split("/")[-1], "parents": [{"id": drive_dir}]}
+        {"title": os.path.basename(path), "parents": [{"id": drive_dir}]}
     )
+    # SetContentFile opens the file and hands PyDrive the handle, but PyDrive
+    # never closes it; close it ourselves so uploads don't leak descriptors.
     upload_file.SetContentFile(path)
-    upload_file.Upload()
+    try:
+        upload_file.Upload(param={"http": _http_for_thread(drive_instance)})
+    finally:
+        upload_file.content.close()
     if delete_local:
         os.remove(path)
+
+
+def upload_files(
+    paths: list[str],
+    drive_dir: str,
+    drive_instance: "_GoogleDrive",
+    *,
+    delete_local: bool = True,
+    max_workers: int = 8,
+) -> dict[str, Exception]:
+    """Upload several files to Google Drive concurrently.
+
+    Parameters
+    ----------
+    paths : list of str
+        Paths of the files to upload
+    drive_dir : str
+        Google Drive folder ID to upload to
+    drive_instance : GoogleDrive
+        Google Drive client instance, shared by all workers.
+    delete_local : bool, keyword-only
+        Whether to delete each local file after upload (default: True).
+    max_workers : int, keyword-only
+        Maximum number of uploads in flight at once (default: 8).
+
+    Returns
+    -------
+    dict
+        Maps each path that failed to upload to the raised exception.
+    """
+    _require_pydrive()
+    failures: dict[str, Exception] = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = {
+            pool.submit(
+                upload_file, path, drive_dir, drive_instance, delete_local=delete_local
+            ): path
+            for path in paths
+        }
+        for future, path in futures.items():
+            exc = future.exception()
+            if exc is not None:
+                failures[path] = exc
+    return failures
@@ -1,29 +1,102 @@
 import argparse
-import asyncio
+import atexit
+import logging
 import os
-import signal
 import sys
-import threading
 
-# Fix pynput's AXIsProcessTrusted threading issue on macOS
-# pynput's MouseListener tries to lazily import AXIsProcessTrusted in a background thread,
-# which fails due to pyobjc's lazy import not being thread-safe. We pre-load it here on the
-# main thread before any listeners start.
-try:
-    from ApplicationServices import AXIsProcessTrusted as _AXIsProcessTrusted
-    from pynput._util import darwin
+logger = logging.getLogger(__name__)
 
-    # Force the lazy load now on main thread
-    if hasattr(darwin, 'HIServices') and hasattr(darwin.HIServices, 'AXIsProcessTrusted'):
-        _ = darwin.HIServices.AXIsProcessTrusted()
-    elif hasattr(darwin, 'HIServices'):
-        darwin.HIServices.AXIsProcessTrusted = _AXIsProcessTrusted
 
-except Exception as e:
-    print(f"Warning: Could not pre-load AXIsProcessTrusted: {e}")
+def _preload_ax_trusted():
+    """Fix pynput's AXIsProcessTrusted threading issue on macOS.
 
-from .gum import gum
-from .observers import Screen
+    pynput's MouseListener tries to lazily import AXIsProcessTrusted in a
+    background thread, which fails due to pyobjc's lazy import not being
+    thread-safe. Pre-load it on the main thread before any listeners start.
+    """
+    try:
+        from ApplicationServices import AXIsProcessTrusted as _AXIsProcessTrusted
+        from pynput._util import darwin
+
+        # Force the lazy load now on main thread
+        if hasattr(darwin, 'HIServices') and hasattr(darwin.HIServices, 'AXIsProcessTrusted'):
+            _ = darwin.HIServices.AXIsProcessTrusted()
+        elif hasattr(darwin, 'HIServices'):
+            darwin.HIServices.AXIsProcessTrusted = _AXIsProcessTrusted
+
+    except Exception as e:
+        logger.warning(f"Could not pre-load AXIsProcessTrusted: {e}")
+
+
+# Loggers owned by the recorder; everything else (aiosqlite, googleapiclient,
+# ...) stays at the root logger's WARNING level.
+_APP_LOGGERS = ("gum", "Screen", "swe_prod_recorder")
+
+# How long shutdown waits for Screen.stop to flush queued screenshots. Draining
+# a full upload queue with retries can take far longer, so anything still
+# pending at the deadline is logged rather than dropped silently.
+_SHUTDOWN_TIMEOUT_SEC = 10
+_UPLOAD_SHUTDOWN_TIMEOUT_SEC = 120
+
+
+def _configure_logging(debug: bool):
+    """Route all log records through a queue drained by a background thread.
+
+    Emitting threads (the pynput listeners and the asyncio loop) only enqueue
+    records; formatting and the blocking write to stderr happen on the
+    returned listener's thread. The caller starts and stops the listener.
+    """
+    import queue
+    from logging.handlers import QueueHandler, QueueListener
+
+    log_queue = queue.SimpleQueue()
+    handler = logging.StreamHandler(sys.stderr)
+    handler.setFormatter(
+        logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    )
+    # QueueHandler pre-renders the message; the listener adds the prefix
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter("%(message)s"))
+    logging.basicConfig(level=logging.WARNING, handlers=[queue_handler])
+    for name in _APP_LOGGERS:
+        logging.getLogger(name).setLevel(logging.DEBUG if debug else logging.INFO)
+    return QueueListener(log_queue, handler, respect_handler_level=True)
+
+
+_BANNER_SEP = "=" * 70
+
+_BANNER_TMPL = f"""
+{_BANNER_SEP}
+⚠️  BEFORE YOU BEGIN RECORDING
+{_BANNER_SEP}
+
+Please make sure your workspace is clean and contains only
+study-related materials.
+
+Close all personal tabs, folders, and unrelated applications.
+
+{{scope}}
+
+You can pause or stop recording at any time using Ctrl + C
+in the terminal.
+
+Recording will automatically stop after {{timeout}} minutes
+of inactivity.
+
+When finished, review your recording and delete anything you
+don't want to share.
+
+{_BANNER_SEP}
+"""
+
+_SCOPE_ALL_SCREENS = (
+    "ALL monitors/screens will be recorded — everything on screen\n"
+    "will be captured."
+)
+_SCOPE_WINDOW = (
+    "Only the window you select will be recorded — activity outside\n"
+    "it will be ignored."
+)
 
 
 def parse_args():
@@ -58,23 +131,41 @@ def parse_args():
     return parser.parse_args()
 
 
-async def _async_main(screen_observer, stop_event):
+def _run_event_loop(coro):
+    """Run ``coro`` to completion on uvloop when it is installed."""
+    try:
+        import uvloop
+    except ImportError:
+        import asyncio
+
+        return asyncio.run(coro)
+    return uvloop.run(coro)
+
+
+async def _async_main(screen_observer, started):
     """Run async event loop in background thread.
 
     This manages the database, observer workers, and update processing.
+    Once gum has connected the database and started the observers,
+    ``started`` resolves to ``(loop, stop_event)``; other threads request
+    shutdown with ``loop.call_soon_threadsafe(stop_event.set)``.
     """
+    import asyncio
+
+    from .gum import gum
+
     data_directory = "data"
     user_name = "anonymous"  # Default user name
 
     try:
         async with gum(user_name, screen_observer, data_directory=data_directory):
-            # Wait for stop signal
-            while not stop_event.is_set():
-                await asyncio.sleep(0.1)
+            stop_event = asyncio.Event()
+            started.set_result((asyncio.get_running_loop(), stop_event))
+            await stop_event.wait()
     except Exception as e:
-        print(f"Error in async loop: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception(f"Error in async loop: {e}")
+        if not started.done():
+            started.set_exception(e)
 
 
 def main():
@@ -89,12 +180,29 @@ def main():
     """
     args = parse_args()
 
+    log_listener = _configure_logging(args.debug)
+    log_listener.start()
+    # Registered with atexit rather than a finally block so records queued
+    # before any of the sys.exit() calls below are still written out.
+    atexit.register(log_listener.stop)
+
+    # Heavy imports (pynput/AppKit, SQLAlchemy, mss, PIL) are deferred until
+    # after argument parsing so ``--help`` and usage errors return quickly.
+    import asyncio
+    import signal
+    import threading
+    from concurrent.futures import Future
+
+    _preload_ax_trusted()
+    from .observers import Screen
+
     if args.upload_to_gdrive:
         try:
             from .auth.google_drive import (
                 USE_GDRIVE,
-                initialize_google_drive,
+                get_drive,
                 _generate_client_secrets_from_env,
+                _has_fresh_credentials,
             )
         except ImportError as exc:
             print(f"Google Drive upload requested but PyDrive is not available: {exc}")
@@ -118,39 +226,26 @@ def main():
                 print("  2. Or place client_secrets.json manually in config/.google_auth/ directory")
                 sys.exit(1)
 
-        # Authenticate with Google Drive (will use cached credentials if available)
-        print("\nAuthenticating with Google Drive...")
-        try:
-            initialize_google_drive("config/.google_auth/client_secrets.json")
-            print("✅ Google Drive authentication successful")
-        except Exception as exc:
-            print(f"❌ Google Drive authentication failed: {exc}")
-            sys.exit(1)
+        # Authenticate with Google Drive unless a still-valid token is cached;
+        # in that case the first upload authorizes lazily without a round-trip.
+        if _has_fresh_credentials():
+            print("\nUsing cached Google Drive credentials")
+        else:
+            print("\nAuthenticating with Google Drive...")
+            try:
+                get_drive("config/.google_auth/client_secrets.json")
+                print("✅ Google Drive authentication successful")
+            except Exception as exc:
+                print(f"❌ Google Drive authentication failed: {exc}")
+                sys.exit(1)
 
     # Display user warning and instructions
-    print("\n" + "=" * 70)
-    print("⚠️  BEFORE YOU BEGIN RECORDING")
-    print("=" * 70)
-    print("\nPlease make sure your workspace is clean and contains only")
-    print("study-related materials.")
-    print("\nClose all personal tabs, folders, and unrelated applications.")
-
-    if args.record_all_screens:
-        print("\nALL monitors/screens will be recorded — everything on screen")
-        print("will be captured.")
-    else:
-        print("\nOnly the window you select will be recorded — activity outside")
-        print("it will be ignored.")
-
-    print("\nYou can pause or stop recording at any time using Ctrl + C")
-    print("in the terminal.")
-    print(
-        f"\nRecording will automatically stop after {args.inactivity_timeout} minutes"
+    sys.stdout.write(
+        _BANNER_TMPL.format(
+            scope=_SCOPE_ALL_SCREENS if args.record_all_screens else _SCOPE_WINDOW,
+            timeout=args.inactivity_timeout,
+        )
     )
-    print("of inactivity.")
-    print("\nWhen finished, review your recording and delete anything you")
-    print("don't want to share.")
-    print("\n" + "=" * 70)
 
     input("\nPress Enter to confirm and start recording...")
     print("\nStarting recording...\n")
@@ -165,44 +260,61 @@ def main():
     )
 
     # Coordination between main and background threads
-    stop_event = threading.Event()
+    started: Future = Future()
 
     # Launch asyncio event loop in background thread
     async_thread = threading.Thread(
-        target=lambda: asyncio.run(_async_main(screen_observer, stop_event)),
+        target=lambda: _run_event_loop(_async_main(screen_observer, started)),
         daemon=True,
         name="AsyncIOThread"
     )
     async_thread.start()
 
-    # Give async loop time to initialize
-    import time
-    time.sleep(0.5)
+    # Wait for gum to finish initializing before starting listeners
+    try:
+        loop, async_stop_event = started.result(timeout=10.0)
+    except Exception:
+        logger.error("❌ Recorder failed to start")
+        sys.exit(1)
+
+    def request_stop():
+        try:
+            loop.call_soon_threadsafe(async_stop_event.set)
+        except RuntimeError:
+            pass  # event loop already closed
 
-    # Set up Ctrl+C handler
+    # Set up Ctrl+C handler. It only stops the listeners so the main thread
+    # falls through to the shutdown below and gum can flush pending writes;
+    # a second Ctrl+C raises KeyboardInterrupt as usual.
     def signal_handler(sig, frame):
-        print("\n\nShutting down...")
-        stop_event.set()
+        logger.info("Shutting down...")
+        signal.signal(signal.SIGINT, signal.default_int_handler)
+        request_stop()
         screen_observer.stop_listeners_sync()
-        sys.exit(0)
 
     signal.signal(signal.SIGINT, signal_handler)
 
     try:
         # Run pynput listeners on main thread (blocks until stopped)
         screen_observer.run_listeners_on_main_thread()
-
-        # Clean shutdown
-        stop_event.set()
-        async_thread.join(timeout=5)
-
     except KeyboardInterrupt:
-        print("\n\nShutting down...")
-        stop_event.set()
-        screen_observer.stop_listeners_sync()
+        logger.info("Shutting down...")
     except Exception as e:
-        print(f"Error: {e}")
-        import traceback
-        traceback.print_exc()
-        stop_event.set()
+        logger.exception(f"Error: {e}")
+    finally:
+        # Clean shutdown
+        request_stop()
         screen_observer.stop_listeners_sync()
+        async_thread.join(
+            timeout=_UPLOAD_SHUTDOWN_TIMEOUT_SEC
+            if args.upload_to_gdrive
+            else _SHUTDOWN_TIMEOUT_SEC
+        )
+        if async_thread.is_alive():
+            unflushed = screen_observer.unflushed_files()
+            if unflushed:
+                logger.warning(
+                    "Shutdown timed out; %d screenshot(s) not flushed:\n  %s",
+                    len(unflushed),
+                    "\n  ".join(unflushed),
+                )
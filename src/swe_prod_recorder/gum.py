@@ -3,13 +3,93 @@ import asyncio
 import logging
 import os
 from contextlib import asynccontextmanager
-from typing import Callable
+from typing import AsyncContextManager, Callable
 
-from .models import Observation, init_db
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .models import (
+    ContentType,
+    Observation,
+    checkpoint_wal,
+    init_db,
+    observations_table,
+)
 from .observers import Observer
 from .schemas import Update
 
 
+class ObservationWriter:
+    """Coalesce observation rows into batched INSERTs.
+
+    Producers call :meth:`submit`; a background task collects rows until
+    ``max_batch`` are pending or ``flush_interval`` seconds have passed since
+    the first one, then writes them all in a single transaction.
+    """
+
+    def __init__(
+        self,
+        session: Callable[[], AsyncContextManager[AsyncSession]],
+        logger: logging.Logger,
+        *,
+        max_batch: int = 128,
+        flush_interval: float = 0.25,
+        max_pending: int = 1024,
+    ):
+        self._session = session
+        self._logger = logger
+        self._max_batch = max_batch
+        self._flush_interval = flush_interval
+        self._queue: asyncio.Queue[dict] = asyncio.Queue(maxsize=max_pending)
+        self._task: asyncio.Task | None = None
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._flush_loop())
+
+    async def submit(self, observer_name: str, content: str, content_type: int):
+        await self._queue.put(
+            {
+                "observer_name": observer_name,
+                "content": content,
+                "content_type": content_type,
+            }
+        )
+
+    async def close(self):
+        """Flush everything submitted so far, then stop the background task."""
+        if self._task:
+            await self._queue.join()
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _flush_loop(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self._flush_interval
+            while len(batch) < self._max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            try:
+                async with self._session() as session:
+                    await session.execute(observations_table.insert(), batch)
+            except Exception:
+                self._logger.exception(f"Failed to write {len(batch)} observations")
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+
 class gum:
     def __init__(
         self,
@@ -19,6 +99,7 @@ class gum:
         db_name: str = "actions.db",
         max_concurrent_updates: int = 4,
         verbosity: int = logging.INFO,
+        wal_checkpoint_interval: float = 60.0,
     ):
         # basic paths
         data_directory = os.path.expanduser(data_directory)
@@ -31,7 +112,8 @@ class gum:
         # logging
         self.logger = logging.getLogger("gum")
         self.logger.setLevel(verbosity)
-        if not self.logger.handlers:
+        # Defer to the application's logging setup when it has one
+        if not self.logger.hasHandlers():
             h = logging.StreamHandler()
             h.setFormatter(
                 logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
@@ -40,12 +122,15 @@ class gum:
 
         self.engine = None
         self.Session = None
+        self._writer: ObservationWriter | None = None
         self._db_name = db_name
         self._data_directory = data_directory
 
         self._update_sem = asyncio.Semaphore(max_concurrent_updates)
         self._tasks: set[asyncio.Task] = set()
         self._loop_task: asyncio.Task | None = None
+        self._checkpoint_interval = wal_checkpoint_interval
+        self._checkpoint_task: asyncio.Task | None = None
         self.update_handlers: list[Callable[[Observer, Update], None]] = []
 
     def start_update_loop(self):
@@ -61,14 +146,26 @@ class gum:
                 pass
             self._loop_task = None
 
+    async def _checkpoint_loop(self):
+        """Keep the WAL file bounded while the recorder runs for hours."""
+        while True:
+            await asyncio.sleep(self._checkpoint_interval)
+            try:
+                await checkpoint_wal(self.engine)
+            except Exception:
+                self.logger.exception("WAL checkpoint failed")
+
     async def connect_db(self):
         if self.engine is None:
             self.engine, self.Session = await init_db(
                 self._db_name, self._data_directory
             )
+            self._writer = ObservationWriter(self._session, self.logger)
 
     async def __aenter__(self):
         await self.connect_db()
+        self._writer.start()
+        self._checkpoint_task = asyncio.create_task(self._checkpoint_loop())
         # Start all observers
         for obs in self.observers:
             obs.start()
@@ -82,31 +179,61 @@ class gum:
         if self._tasks:
             await asyncio.gather(*self._tasks, return_exceptions=True)
 
+        # persist any observations still waiting for a batch
+        await self._writer.close()
+
         # stop observers
         for obs in self.observers:
             await obs.stop()
 
+        if self._checkpoint_task:
+            self._checkpoint_task.cancel()
+            try:
+                await self._checkpoint_task
+            except asyncio.CancelledError:
+                pass
+            self._checkpoint_task = None
+
+        try:
+            await checkpoint_wal(self.engine)
+        except Exception:
+            self.logger.exception("Final WAL checkpoint failed")
+        finally:
+            await self.engine.dispose()
+            self.engine = None
+
     async def _update_loop(self):
         """
         Efficiently wait for *any* observer to produce an Update and
         dispatch it through the semaphore-guarded handler.
         """
-        while True:
-            gets = {
-                asyncio.create_task(obs.update_queue.get()): obs
-                for obs in self.observers
-            }
+        # One outstanding get() per observer, re-armed only once it completes,
+        # so an idle observer's pending get never swallows a later update.
+        gets = {
+            asyncio.create_task(obs.update_queue.get()): obs
+            for obs in self.observers
+        }
+        try:
+            while True:
+                done, _ = await asyncio.wait(
+                    gets.keys(), return_when=asyncio.FIRST_COMPLETED
+                )
 
-            done, _ = await asyncio.wait(
-                gets.keys(), return_when=asyncio.FIRST_COMPLETED
-            )
+                for fut in done:
+                    obs = gets.pop(fut)
+                    updates = [fut.result()]
+                    # Take whatever else is already queued without a task each
+                    while not obs.update_queue.empty():
+                        updates.append(obs.update_queue.get_nowait())
 
-            for fut in done:
-                upd: Update = fut.result()
-                obs = gets[fut]
+                    for upd in updates:
+                        t = asyncio.create_task(self._run_with_gate(obs, upd))
+                        self._tasks.add(t)
 
-                t = asyncio.create_task(self._run_with_gate(obs, upd))
-                self._tasks.add(t)
+                    gets[asyncio.create_task(obs.update_queue.get())] = obs
+        finally:
+            for fut in gets:
+                fut.cancel()
 
     async def _run_with_gate(self, observer: Observer, update: Update):
         """Wrapper that enforces max_concurrent_updates."""
@@ -124,18 +251,17 @@ class gum:
         # self.logger.info(f"Content ({update.content_type}): {update.content[:10]}")
         self.logger.info(f"Content ({update.content_type}): {update.content}")
 
-        async with self._session() as session:
-            observation = Observation(
-                observer_name=observer.name,
-                content=update.content,
-                content_type=update.content_type,
-            )
+        content_type = ContentType[update.content_type.upper()]
+        observation = Observation(
+            observer_name=observer.name,
+            content=update.content,
+            content_type=content_type,
+        )
 
-            if await self._handle_audit(observation):
-                return
+        if await self._handle_audit(observation):
+            return
 
-            session.add(observation)
-            await session.flush()
+        await self._writer.submit(observer.name, update.content, content_type)
 
     @asynccontextmanager
     async def _session(self):
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 import pathlib
+from enum import IntEnum
 from typing import Optional
 
-from sqlalchemy import DateTime, String, Text
+from sqlalchemy import Index, SmallInteger, String, Text, event
 from sqlalchemy import text as sql_text
 from sqlalchemy.ext.asyncio import (
     AsyncAttrs,
@@ -12,7 +13,42 @@ from sqlalchemy.ext.asyncio import (
     create_async_engine,
 )
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
-from sqlalchemy.sql import func
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+
+# Applied to every new connection: most of these are per-connection settings
+# that SQLite does not persist in the database file.
+_SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA busy_timeout=30000",
+    "PRAGMA synchronous=NORMAL",  # WAL stays consistent; fsync only at checkpoints
+    "PRAGMA cache_size=-65536",  # 64 MiB page cache
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",  # 256 MiB
+    "PRAGMA foreign_keys=ON",
+    "PRAGMA wal_autocheckpoint=2000",  # gum also checkpoints on a timer
+)
+
+
+def _apply_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    cursor = dbapi_connection.cursor()
+    for pragma in _SQLITE_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
+
+
+def _begin_immediate(conn) -> None:
+    # The driver runs in autocommit mode (isolation_level=None), so emit
+    # BEGIN ourselves and take the write lock up front rather than on the
+    # first INSERT, where contention would fail mid-transaction.
+    conn.exec_driver_sql("BEGIN IMMEDIATE")
+
+
+class ContentType(IntEnum):
+    """Stored form of ``Update.content_type``; member names match its values."""
+
+    INPUT_TEXT = 1
+    INPUT_IMAGE = 2
 
 
 class Base(AsyncAttrs, DeclarativeBase):
@@ -21,19 +57,24 @@ class Base(AsyncAttrs, DeclarativeBase):
 
 class Observation(Base):
     __tablename__ = "observations"
+    __table_args__ = (
+        Index("ix_obs_observer_created", "observer_name", "created_at"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     observer_name: Mapped[str] = mapped_column(String(100), nullable=False)
     content: Mapped[str] = mapped_column(Text, nullable=False)
-    content_type: Mapped[str] = mapped_column(String(50), nullable=False)
+    content_type: Mapped[int] = mapped_column(SmallInteger, nullable=False)
 
+    # Plain TEXT timestamps ("YYYY-MM-DD HH:MM:SS", UTC) filled in by SQLite,
+    # so rows are never round-tripped through Python datetime adapters.
     created_at: Mapped[str] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), nullable=False
+        Text, server_default=sql_text("CURRENT_TIMESTAMP"), nullable=False
     )
     updated_at: Mapped[str] = mapped_column(
-        DateTime(timezone=True),
-        server_default=func.now(),
-        onupdate=func.now(),
+        Text,
+        server_default=sql_text("CURRENT_TIMESTAMP"),
+        onupdate=sql_text("CURRENT_TIMESTAMP"),
         nullable=False,
     )
 
@@ -41,6 +82,54 @@ class Observation(Base):
         return f"<Observation(id={self.id}, observer={self.observer_name})>"
 
 
+# Core table for the write path: inserting through it skips ORM bulk-insert
+# handling and attribute instrumentation.
+observations_table = Observation.__table__
+
+
+def _create_missing_indexes(sync_conn) -> None:
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(sync_conn, checkfirst=True)
+
+
+def _migrate_content_type(sync_conn) -> None:
+    """Convert databases that still store ``content_type`` as strings.
+
+    The old column has TEXT affinity, so SQLite would keep updated values as
+    text; the table is rebuilt with the SMALLINT column instead.
+    """
+    columns = {
+        row[1]: row[2]
+        for row in sync_conn.exec_driver_sql("PRAGMA table_info(observations)")
+    }
+    if columns.get("content_type", "SMALLINT").upper() == "SMALLINT":
+        return
+
+    sync_conn.exec_driver_sql("ALTER TABLE observations RENAME TO observations_old")
+    for index in observations_table.indexes:
+        sync_conn.exec_driver_sql(f"DROP INDEX IF EXISTS {index.name}")
+    observations_table.create(sync_conn)
+
+    cases = " ".join(f"WHEN '{ct.name.lower()}' THEN {ct.value}" for ct in ContentType)
+    sync_conn.exec_driver_sql(
+        "INSERT INTO observations "
+        "(id, observer_name, content, content_type, created_at, updated_at) "
+        f"SELECT id, observer_name, content, CASE content_type {cases} END, "
+        "created_at, updated_at FROM observations_old"
+    )
+    sync_conn.exec_driver_sql("DROP TABLE observations_old")
+
+
+async def checkpoint_wal(engine: AsyncEngine) -> None:
+    """Copy the WAL back into the database file and truncate it to zero."""
+    async with engine.connect() as conn:
+        raw = await conn.get_raw_connection()
+        # Bypass SQLAlchemy so no BEGIN is emitted: SQLite refuses to
+        # checkpoint from inside a transaction on the same connection.
+        await raw.driver_connection.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+
 async def init_db(
     db_path: str = "gum.db",
     db_directory: Optional[str] = None,
@@ -51,21 +140,32 @@ async def init_db(
         path.mkdir(parents=True, exist_ok=True)
         db_path = str(path / db_path)
 
+    # SQLite admits one writer at a time, so keep exactly one pooled
+    # connection: concurrent writers wait for it in the pool instead of
+    # contending for the database lock.
     engine: AsyncEngine = create_async_engine(
         f"sqlite+aiosqlite:///{db_path}",
         future=True,
         connect_args={
             "timeout": 30,
             "isolation_level": None,
+            # The pooled connection lives for the whole session, so keep the
+            # prepared INSERT (and friends) cached instead of re-parsing them.
+            "cached_statements": 512,
         },
-        poolclass=None,
+        poolclass=AsyncAdaptedQueuePool,
+        pool_size=1,
+        max_overflow=0,
     )
 
-    async with engine.begin() as conn:
-        await conn.execute(sql_text("PRAGMA journal_mode=WAL"))
-        await conn.execute(sql_text("PRAGMA busy_timeout=30000"))
+    event.listen(engine.sync_engine, "connect", _apply_sqlite_pragmas)
+    event.listen(engine.sync_engine, "begin", _begin_immediate)
 
+    async with engine.begin() as conn:
+        await conn.run_sync(_migrate_content_type)
         await conn.run_sync(Base.metadata.create_all)
+        # create_all skips indexes on tables that already exist
+        await conn.run_sync(_create_missing_indexes)
 
     Session = async_sessionmaker(engine, expire_on_commit=False, autoflush=False)
     return engine, Session
@@ -24,13 +24,15 @@ from __future__ import annotations
 
 import asyncio
 import base64
-import gc
 import logging
+import math
 import os
+import shutil
+import threading
 import time
 from collections import deque
 from concurrent.futures import ThreadPoolExecutor
-from functools import partial
+from functools import lru_cache, partial
 from importlib.resources import files as get_package_file
 from typing import Any, Dict, Iterable, List, Optional
 
@@ -38,8 +40,6 @@ import mss
 from PIL import Image, ImageDraw
 
 from pynput import keyboard, mouse  # still synchronous
-from shapely.geometry import box
-from shapely.ops import unary_union
 
 from ..schemas import Update
 from .observer import Observer
@@ -48,6 +48,7 @@ from .window import select_region_with_mouse
 from ..auth.google_drive import (  # noqa: F401
     USE_GDRIVE,
     find_folder_by_name,
+    get_drive,
     initialize_google_drive,
     upload_file,
 )
@@ -58,6 +59,16 @@ from ..auth.google_drive import (  # noqa: F401
 ###############################################################################
 
 
+# The display layout only changes on hotplug or a resolution change, yet the
+# bounds are needed for every coordinate conversion; re-query at most every
+# _GLOBAL_BOUNDS_TTL seconds.
+_GLOBAL_BOUNDS_TTL = 2.0
+_global_bounds_cache: tuple[float, Optional[tuple[float, float, float, float]]] = (
+    0.0,
+    None,
+)
+
+
 def _get_global_bounds() -> tuple[float, float, float, float]:
     """Return a bounding box enclosing **all** physical displays.
 
@@ -65,6 +76,27 @@ def _get_global_bounds() -> tuple[float, float, float, float]:
     -------
     (min_x, min_y, max_x, max_y) tuple in Quartz global coordinates.
     """
+    global _global_bounds_cache
+    stamp, bounds = _global_bounds_cache
+    now = time.monotonic()
+    if bounds is None or now - stamp >= _GLOBAL_BOUNDS_TTL:
+        bounds = _query_global_bounds()
+        _global_bounds_cache = (now, bounds)
+    return bounds
+
+
+def _fresh_global_bounds() -> Optional[tuple[float, float, float, float]]:
+    """Cached result of :func:`_get_global_bounds` if still fresh, else None.
+
+    Never calls into Quartz, so it is safe to use directly on the event loop.
+    """
+    stamp, bounds = _global_bounds_cache
+    if bounds is None or time.monotonic() - stamp >= _GLOBAL_BOUNDS_TTL:
+        return None
+    return bounds
+
+
+def _query_global_bounds() -> tuple[float, float, float, float]:
     import Quartz
 
     err, ids, cnt = Quartz.CGGetActiveDisplayList(16, None, None)
@@ -82,80 +114,205 @@ def _get_global_bounds() -> tuple[float, float, float, float]:
     return min_x, min_y, max_x, max_y
 
 
-def _get_visible_windows() -> List[tuple[dict, float]]:
-    """List *onscreen* windows with their visible‑area ratio.
+# Window owners that are system chrome rather than user-facing applications.
+_SYSTEM_OWNERS = frozenset(("Dock", "WindowServer", "Window Server"))
 
-    Each tuple is ``(window_info_dict, visible_ratio)`` where *visible_ratio*
-    is in ``[0.0, 1.0]``.  Internal system windows (Dock, WindowServer, …) are
-    ignored.
-    """
+
+@lru_cache(maxsize=1)
+def _menubar_level() -> int:
+    """Window level of the menu bar; fixed for the lifetime of the process."""
     import Quartz
 
-    _, _, _, gmax_y = _get_global_bounds()
+    return Quartz.CGWindowLevelForKey(Quartz.kCGMainMenuWindowLevelKey)
 
-    opts = (
-        Quartz.kCGWindowListOptionOnScreenOnly
-        | Quartz.kCGWindowListOptionIncludingWindow
-    )
-    wins = Quartz.CGWindowListCopyWindowInfo(opts, Quartz.kCGNullWindowID)
 
-    occupied = None  # running union of opaque regions above the current window
-    result: list[tuple[dict, float]] = []
+# One CGWindowListCopyWindowInfo walk of the WindowServer is shared by every
+# lookup made within _WINDOW_LIST_TTL seconds, so a single interaction (region
+# hit test, topmost check, bounds refresh) costs one Quartz call.
+_WINDOW_LIST_TTL = 0.05
+_window_list_lock = threading.Lock()
 
+
+def _window_candidates(wins) -> list[tuple]:
+    """``(info, x, y, w, h)`` for non-system windows with a real size, front to back."""
+    result = []
     for info in wins:
-        owner = info.get("kCGWindowOwnerName", "")
-        if owner in ("Dock", "WindowServer", "Window Server"):
+        if info.get("kCGWindowOwnerName", "") in _SYSTEM_OWNERS:
             continue
-
         bounds = info.get("kCGWindowBounds", {})
-        x, y, w, h = (
-            bounds.get("X", 0),
-            bounds.get("Y", 0),
-            bounds.get("Width", 0),
-            bounds.get("Height", 0),
-        )
+        w, h = bounds.get("Width", 0), bounds.get("Height", 0)
         if w <= 0 or h <= 0:
             continue  # hidden or minimised
+        result.append((info, bounds.get("X", 0), bounds.get("Y", 0), w, h))
+    return result
 
-        inv_y = gmax_y - y - h  # Quartz→Shapely Y‑flip (convert top edge)
-        poly = box(x, inv_y, x + w, inv_y + h)
-        if poly.is_empty:
-            continue
 
-        visible = poly if occupied is None else poly.difference(occupied)
-        if not visible.is_empty:
-            ratio = visible.area / poly.area
+class _WindowSnapshot:
+    """One on-screen window list plus lookups derived from it on first use.
+
+    Every helper filters or indexes the same list, so each view is built
+    once per snapshot instead of once per call.
+    """
+
+    __slots__ = ("stamp", "wins", "_rects", "_candidates", "_by_id")
+
+    def __init__(self, stamp: float, wins) -> None:
+        self.stamp = stamp
+        self.wins = wins or ()
+        self._rects: Optional[list[tuple]] = None
+        self._candidates: Optional[list[tuple]] = None
+        self._by_id: Optional[dict] = None
+
+    @property
+    def rects(self) -> list[tuple]:
+        """Hit-test records ``(x0, y0, x1, y1, window_id, owner, layer)``.
+
+        Quartz window coordinates (Y=0 at top), front to back.
+        """
+        if self._rects is None:
+            rects = []
+            for info in self.wins:
+                bounds = info.get("kCGWindowBounds")
+                if not bounds:
+                    continue
+                x, y = bounds.get("X", 0), bounds.get("Y", 0)
+                rects.append((
+                    x,
+                    y,
+                    x + bounds.get("Width", 0),
+                    y + bounds.get("Height", 0),
+                    info.get("kCGWindowNumber"),
+                    info.get("kCGWindowOwnerName", "Unknown"),
+                    info.get("kCGWindowLayer", 0),
+                ))
+            self._rects = rects
+        return self._rects
+
+    @property
+    def candidates(self) -> list[tuple]:
+        """See :func:`_window_candidates`."""
+        if self._candidates is None:
+            self._candidates = _window_candidates(self.wins)
+        return self._candidates
+
+    @property
+    def by_id(self) -> dict:
+        """Window info dicts keyed by window number."""
+        if self._by_id is None:
+            self._by_id = {info.get("kCGWindowNumber"): info for info in self.wins}
+        return self._by_id
+
+
+_window_snapshot: Optional[_WindowSnapshot] = None
+
+
+def _onscreen_snapshot(ttl: float = _WINDOW_LIST_TTL) -> _WindowSnapshot:
+    """Return the on-screen window snapshot, re-querying Quartz once it is stale."""
+    global _window_snapshot
+    with _window_list_lock:
+        snapshot = _window_snapshot
+        now = time.monotonic()
+        if snapshot is None or now - snapshot.stamp >= ttl:
+            import Quartz
+
+            snapshot = _window_snapshot = _WindowSnapshot(
+                now,
+                Quartz.CGWindowListCopyWindowInfo(
+                    Quartz.kCGWindowListOptionOnScreenOnly, Quartz.kCGNullWindowID
+                ),
+            )
+        return snapshot
+
+
+def _invalidate_onscreen_windows() -> None:
+    global _window_snapshot
+    with _window_list_lock:
+        _window_snapshot = None
+
+
+def _covered_area(rect: tuple, occluders: list[tuple]) -> float:
+    """Area of *rect* covered by the union of *occluders*.
+
+    All rectangles are axis-aligned ``(x0, y0, x1, y1)``.  Sweeps the distinct
+    X edges of the clipped occluders and, per vertical slab, merges the Y
+    intervals of the occluders spanning it.
+    """
+    rx0, ry0, rx1, ry1 = rect
+    clipped = []
+    for ox0, oy0, ox1, oy1 in occluders:
+        cx0, cy0 = max(ox0, rx0), max(oy0, ry0)
+        cx1, cy1 = min(ox1, rx1), min(oy1, ry1)
+        if cx0 < cx1 and cy0 < cy1:
+            clipped.append((cx0, cy0, cx1, cy1))
+    if not clipped:
+        return 0.0
+
+    xs = sorted({x for c in clipped for x in (c[0], c[2])})
+    area = 0.0
+    for sx0, sx1 in zip(xs, xs[1:]):
+        spans = sorted((c[1], c[3]) for c in clipped if c[0] <= sx0 and sx1 <= c[2])
+        covered = 0.0
+        cur0 = cur1 = None
+        for y0, y1 in spans:
+            if cur1 is None or y0 > cur1:
+                if cur1 is not None:
+                    covered += cur1 - cur0
+                cur0, cur1 = y0, y1
+            elif y1 > cur1:
+                cur1 = y1
+        if cur1 is not None:
+            covered += cur1 - cur0
+        area += covered * (sx1 - sx0)
+    return area
+
+
+def _get_visible_windows(
+    snapshot: Optional[_WindowSnapshot] = None,
+) -> List[tuple[dict, float]]:
+    """List *onscreen* windows with their visible‑area ratio.
+
+    Each tuple is ``(window_info_dict, visible_ratio)`` where *visible_ratio*
+    is in ``[0.0, 1.0]``.  Internal system windows (Dock, WindowServer, …) are
+    ignored.
+    """
+    if snapshot is None:
+        snapshot = _onscreen_snapshot()
+
+    # Windows are axis-aligned rectangles listed front to back, so each one's
+    # visible area is its own area minus the part covered by the windows
+    # already seen.  Areas do not depend on the Y direction, so the Quartz
+    # window coordinates are used as-is.
+    above: list[tuple[float, float, float, float]] = []
+    result: list[tuple[dict, float]] = []
+
+    for info, x, y, w, h in snapshot.candidates:
+        rect = (x, y, x + w, y + h)
+        area = w * h
+        ratio = (area - _covered_area(rect, above)) / area
+        if ratio > 1e-9:  # tolerate float residue on fully covered windows
             result.append((info, ratio))
-            occupied = poly if occupied is None else unary_union([occupied, poly])
+        above.append(rect)
 
     return result
 
 
-def _window_exists(window_id: int) -> bool:
-    """Check if a window exists (even if not visible/on-screen).
+def _existing_window_ids() -> set[int]:
+    """IDs of every window that exists, even if not visible/on-screen.
 
-    Returns
-    -------
-    bool
-        True if window exists (open, minimized, or on different Space), False if closed
+    A window missing from this set is closed; one present but not on screen
+    is minimized or on a different Space.
     """
     import Quartz
 
     # Query ALL windows, not just on-screen ones
     opts = Quartz.kCGWindowListOptionAll
     wins = Quartz.CGWindowListCopyWindowInfo(opts, Quartz.kCGNullWindowID)
+    return {info.get("kCGWindowNumber") for info in wins or ()}
 
-    if not wins:
-        return False
 
-    for info in wins:
-        wid = info.get("kCGWindowNumber")
-        if wid == window_id:
-            return True
-    return False
-
-
-def _get_window_bounds_by_id(window_id: int) -> Optional[tuple[dict, str]]:
+def _get_window_bounds_by_id(
+    window_id: int, snapshot: Optional[_WindowSnapshot] = None
+) -> Optional[tuple[dict, str]]:
     """Get window bounds and owner by window ID (only for visible on-screen windows).
 
     Returns
@@ -164,39 +321,66 @@ def _get_window_bounds_by_id(window_id: int) -> Optional[tuple[dict, str]]:
         (Bounds dict, owner name) if window is visible, (None, None) otherwise.
         Bounds: {'left': x, 'top': y, 'width': w, 'height': h}
     """
-    import Quartz
-
     _, _, _, gmax_y = _get_global_bounds()
 
-    opts = (
-        Quartz.kCGWindowListOptionOnScreenOnly
-        | Quartz.kCGWindowListOptionIncludingWindow
-    )
-    wins = Quartz.CGWindowListCopyWindowInfo(opts, Quartz.kCGNullWindowID)
+    if snapshot is None:
+        snapshot = _onscreen_snapshot()
 
-    for info in wins:
-        wid = info.get("kCGWindowNumber")
-        if wid == window_id:
-            bounds = info.get("kCGWindowBounds", {})
-            owner = info.get("kCGWindowOwnerName", "")
-            x = int(bounds.get("X", 0))
-            y = int(bounds.get("Y", 0))
-            w = int(bounds.get("Width", 0))
-            h = int(bounds.get("Height", 0))
-            if w > 0 and h > 0:
-                # CGWindowBounds returns Quartz coordinates (Y=0 at bottom)
-                # Convert to screen coordinates (Y=0 at top)
-                top = int(gmax_y - y - h)
-                return {"left": x, "top": top, "width": w, "height": h}, owner
+    info = snapshot.by_id.get(window_id)
+    if info is not None:
+        bounds = info.get("kCGWindowBounds", {})
+        owner = info.get("kCGWindowOwnerName", "")
+        x = int(bounds.get("X", 0))
+        y = int(bounds.get("Y", 0))
+        w = int(bounds.get("Width", 0))
+        h = int(bounds.get("Height", 0))
+        if w > 0 and h > 0:
+            # CGWindowBounds returns Quartz coordinates (Y=0 at bottom)
+            # Convert to screen coordinates (Y=0 at top)
+            top = int(gmax_y - y - h)
+            return {"left": x, "top": top, "width": w, "height": h}, owner
     return None, None
 
+
 def _is_app_visible(names: Iterable[str]) -> bool:
     """Return *True* if **any** window from *names* is at least partially visible."""
     targets = set(names)
-    return any(
-        info.get("kCGWindowOwnerName", "") in targets and ratio > 0
-        for info, ratio in _get_visible_windows()
-    )
+    above: list[tuple[float, float, float, float]] = []
+
+    # Same front-to-back walk as _get_visible_windows, but only target windows
+    # are measured and the walk stops at the first one left uncovered.
+    for info, x, y, w, h in _onscreen_snapshot().candidates:
+        rect = (x, y, x + w, y + h)
+        if info.get("kCGWindowOwnerName", "") in targets and not any(
+            ox0 <= rect[0] and oy0 <= rect[1] and rect[2] <= ox1 and rect[3] <= oy1
+            for ox0, oy0, ox1, oy1 in above
+        ):
+            if (w * h - _covered_area(rect, above)) / (w * h) > 1e-9:
+                return True
+        above.append(rect)
+    return False
+
+
+@lru_cache(maxsize=32)
+def _overlay_geometry(
+    frame_w: int, frame_h: int, mon_w: float, mon_h: float
+) -> tuple[float, float, int, int, int]:
+    """Scale and highlight sizes for a frame captured from a region.
+
+    Returns ``(scale_x, scale_y, box_size, crosshair_size, crosshair_width)``.
+    These depend only on the frame and region sizes, which stay the same for
+    every capture of a given window.
+    """
+    # Compute actual scale factor from frame vs monitor dimensions
+    # This handles any DPI (1.0x, 1.5x, 2.0x, 2.5x, etc.) correctly
+    scale_x = frame_w / mon_w
+    scale_y = frame_h / mon_h
+    # Use average scale for box size to handle non-uniform scaling
+    avg_scale = (scale_x + scale_y) / 2.0
+    box_size = int(30 * avg_scale)  # 30 logical points
+    crosshair_size = int(15 * avg_scale)  # 15 logical points
+    crosshair_width = max(2, int(3 * avg_scale))
+    return scale_x, scale_y, box_size, crosshair_size, crosshair_width
 
 ###############################################################################
 # Screen observer                                                             #
@@ -235,8 +419,16 @@ class Screen(Observer):
     _PERIODIC_SEC: int = 30
     _DEBOUNCE_SEC: int = 1
     _MON_START: int = 1  # first real display in mss
-    _MEMORY_CLEANUP_INTERVAL: int = 10  # More frequent GC to prevent memory buildup
     _MAX_WORKERS: int = 4  # Limit thread pool size to prevent exhaustion
+    _UPLOAD_WORKERS: int = 2  # Concurrent Google Drive uploads
+    _UPLOAD_QUEUE_SIZE: int = 64  # Pending uploads before capture back-pressures
+    _UPLOAD_ATTEMPTS: int = 3  # Tries per file, with 1 s, 2 s backoff in between
+    _ENCODE_WORKERS: int = 2  # Concurrent screenshot annotate + JPEG encodes
+    _ENCODE_QUEUE_SIZE: int = 8  # Raw frames held before handlers back-pressure
+    _JPEG_QUALITY: int = 50  # Reduced to 50 for better performance
+    # optimize=True adds a second pass to build custom Huffman tables: a few
+    # percent smaller files for noticeably more encode time per frame.
+    _JPEG_OPTIMIZE: bool = False
     _MAX_SCREENSHOT_AGE: int = None 
 
     # Scroll filtering constants
@@ -281,8 +473,29 @@ class Screen(Observer):
         self._gdrive_dir = gdrive_dir
         self._drive_client = None
         self._drive_folder_id: Optional[str] = None
-        self._gdrive_tasks: set[asyncio.Task] = set()
         self._gdrive_setup_failed = False
+        self._gdrive_init_lock = asyncio.Lock()
+
+        # Uploads are queued and drained by background tasks so capture never
+        # waits on Drive; they run on their own pool, one HTTP object per thread.
+        self._upload_queue: asyncio.Queue[str] = asyncio.Queue(
+            maxsize=self._UPLOAD_QUEUE_SIZE
+        )
+        self._upload_tasks: list[asyncio.Task] = []
+        self._upload_pool: Optional[ThreadPoolExecutor] = None
+
+        # Screenshots are annotated and encoded off the event loop: handlers
+        # queue the raw frame and move on, encode workers write the JPEG and
+        # hand the path to the upload queue.
+        self._encode_queue: asyncio.Queue[tuple] = asyncio.Queue(
+            maxsize=self._ENCODE_QUEUE_SIZE
+        )
+        self._encode_tasks: list[asyncio.Task] = []
+        # Futures resolved once the JPEG at a queued path is on disk (or failed)
+        self._pending_writes: dict[str, asyncio.Future] = {}
+        self._encode_pool = ThreadPoolExecutor(
+            max_workers=self._ENCODE_WORKERS, thread_name_prefix="FrameEncode"
+        )
 
         if self.upload_to_gdrive:
             if not USE_GDRIVE:
@@ -292,6 +505,9 @@ class Screen(Observer):
                 )
             # Google Drive initialization will be done lazily on first upload
             # to allow credential caching and avoid repeated auth prompts
+            self._upload_pool = ThreadPoolExecutor(
+                max_workers=self._UPLOAD_WORKERS, thread_name_prefix="DriveUpload"
+            )
 
         # Custom thread pool to prevent exhaustion
         self._thread_pool = ThreadPoolExecutor(max_workers=self._MAX_WORKERS)
@@ -315,9 +531,10 @@ class Screen(Observer):
         self._key_activity_timeout: float = (
             keyboard_timeout  # seconds of inactivity to consider session ended
         )
-        self._key_screenshots: List[
-            str
-        ] = []  # track intermediate screenshots for cleanup
+        # Latest screenshot of the current session (renamed to "_final" when
+        # the session ends) and how many the session has saved so far
+        self._key_last_path: Optional[str] = None
+        self._key_screenshot_count: int = 0
         self._key_activity_lock = asyncio.Lock()
 
         # scroll activity tracking
@@ -325,49 +542,52 @@ class Screen(Observer):
         self._scroll_last_position: Optional[tuple[float, float]] = None
         self._scroll_session_start: Optional[float] = None
         self._scroll_event_count: int = 0
-        self._scroll_lock = asyncio.Lock()
+        # Scroll filtering runs on the pynput thread (see safe_schedule_scroll)
+        self._scroll_lock = threading.Lock()
 
         # Inactivity timeout tracking
         self._inactivity_timeout = inactivity_timeout
+        # Wall-clock time: the monotonic clock stops while the machine sleeps,
+        # and a closed lid must still count towards the inactivity stop
         self._last_activity_time: Optional[float] = None
         self._inactivity_lock = asyncio.Lock()
         self._after_delay = 0.12
 
         # Window tracking configuration (support for multiple windows)
         self._track_window_id = track_window_id
+        self._sct: Optional[mss.base.MSSBase] = None
         self._tracked_windows: List[
             dict
-        ] = []  # List of {"id": window_id, "region": {...}, "fixed": bool}
+        ] = []  # List of {"id": window_id, "region": {...}, "idx": int, ...}
         self._current_region_lock = asyncio.Lock()
 
         # Set target region from coordinates, window tracking, or mouse selection
         if record_all_screens:
             # Record all monitors/screens
-            import mss
-            with mss.mss() as sct:
-                # Convert regions from Quartz coordinates to screen coordinates
-                _, _, _, gmax_y = _get_global_bounds()
-
-                # Iterate through all monitors (skip monitor 0 which is all monitors combined)
-                for i, monitor in enumerate(sct.monitors[1:], 1):
-                    # mss uses Quartz coords (Y=0 at bottom), need to convert to screen coords (Y=0 at top)
-                    mss_top = monitor["top"]
-                    mss_height = monitor["height"]
-                    screen_top = gmax_y - mss_top - mss_height
-
-                    region = {
-                        "left": monitor["left"],
-                        "top": int(screen_top),
-                        "width": monitor["width"],
-                        "height": monitor["height"]
-                    }
-                    self._tracked_windows.append({
-                        "id": None,  # No window tracking for full screen recording
-                        "region": region,
-                        "original_size": None  # Fixed region, never update
-                    })
-                    if self.debug:
-                        log.info(f"Recording full screen - Monitor {i}: {region}")
+            sct = self._get_sct()
+            # Convert regions from Quartz coordinates to screen coordinates
+            _, _, _, gmax_y = _get_global_bounds()
+
+            # Iterate through all monitors (skip monitor 0 which is all monitors combined)
+            for i, monitor in enumerate(sct.monitors[1:], 1):
+                # mss uses Quartz coords (Y=0 at bottom), need to convert to screen coords (Y=0 at top)
+                mss_top = monitor["top"]
+                mss_height = monitor["height"]
+                screen_top = gmax_y - mss_top - mss_height
+
+                region = {
+                    "left": monitor["left"],
+                    "top": int(screen_top),
+                    "width": monitor["width"],
+                    "height": monitor["height"]
+                }
+                self._tracked_windows.append({
+                    "id": None,  # No window tracking for full screen recording
+                    "region": region,
+                    "original_size": None  # Fixed region, never update
+                })
+                if self.debug:
+                    log.info(f"Recording full screen - Monitor {i}: {region}")
 
             log.info(f"Recording all {len(self._tracked_windows)} monitor(s)")
         elif track_window_id:
@@ -404,11 +624,9 @@ class Screen(Observer):
                 log.debug(f"Global max Y: {gmax_y}")
 
             # Get screen dimensions to detect fullscreen selections
-            import mss
-            with mss.mss() as sct:
-                screen_bounds = sct.monitors[1]  # Primary monitor
-                screen_width = screen_bounds["width"]
-                screen_height = screen_bounds["height"]
+            screen_bounds = self._get_sct().monitors[1]  # Primary monitor
+            screen_width = screen_bounds["width"]
+            screen_height = screen_bounds["height"]
 
             for region, window_id in zip(regions, window_ids):
                 # Skip zero-sized regions (created by clicks without drag)
@@ -457,6 +675,11 @@ class Screen(Observer):
 
             log.info(f"Total windows/regions selected: {len(self._tracked_windows)}")
 
+        # Number each region once so event handlers can label captures without
+        # searching the list (and comparing dicts) on every event
+        for idx, tracked in enumerate(self._tracked_windows, 1):
+            tracked["idx"] = idx  # 1-indexed for display
+
         # Detect and store high-DPI status
         self._is_high_dpi = self._detect_high_dpi()
 
@@ -473,18 +696,41 @@ class Screen(Observer):
         self._start_listeners_on_main_thread = start_listeners_on_main_thread
         self._listeners_started = False
 
+        # Listener threads append (handler, args) here; _dispatch_events
+        # starts the handlers on the event loop.  The loop is only woken when
+        # the dispatcher is idle, instead of once per event.
+        self._event_ring: deque[tuple] = deque(maxlen=4096)
+        self._event_ring_lock = threading.Lock()
+        self._event_wakeup = asyncio.Event()
+        self._dispatch_idle = True
+        self._dispatch_task: Optional[asyncio.Task] = None
+        self._event_tasks: set[asyncio.Task] = set()
+
         # Define listener callbacks that safely schedule events to async loop
         def safe_schedule_event(x: float, y: float, typ: str):
             if self._loop and self._mouse_handler:
-                asyncio.run_coroutine_threadsafe(self._mouse_handler(x, y, typ), self._loop)
+                self._post_event(self._mouse_handler, x, y, typ)
 
         def safe_schedule_scroll(x: float, y: float, dx: float, dy: float):
-            if self._loop and self._scroll_handler:
-                asyncio.run_coroutine_threadsafe(self._scroll_handler(x, y, dx, dy), self._loop)
+            if not (self._loop and self._scroll_handler):
+                return
+            # A trackpad delivers dozens of notches per second and most are
+            # dropped by the filter, so decide here instead of waking the
+            # event loop for each one.  The filter only compares distances,
+            # which the Cocoa→screen Y flip does not change.
+            with self._scroll_lock:
+                accepted = self._should_log_scroll(x, y, dx, dy)
+            if not accepted:
+                if self.debug:
+                    logging.getLogger("Screen").info(
+                        f"Scroll filtered out: dx={dx:.2f}, dy={dy:.2f}"
+                    )
+                return
+            self._post_event(self._scroll_handler, x, y, dx, dy)
 
         def safe_schedule_key(key, typ: str):
             if self._loop and self._key_handler:
-                asyncio.run_coroutine_threadsafe(self._key_handler(key, typ), self._loop)
+                self._post_event(self._key_handler, key, typ)
 
         # Store listener factory functions for deferred initialization
         self._mouse_listener_factory = lambda: mouse.Listener(
@@ -498,7 +744,6 @@ class Screen(Observer):
         # Adjust settings for high-DPI displays
         if self._is_high_dpi:
             self._CAPTURE_FPS = 3  # Even lower FPS for high-DPI displays
-            self._MEMORY_CLEANUP_INTERVAL = 20  # More frequent cleanup
             if self.debug:
                 logging.getLogger("Screen").info(
                     "High-DPI display detected, using conservative settings"
@@ -530,10 +775,13 @@ class Screen(Observer):
             "height": screen_region["height"]
         }
 
-    async def _update_tracked_regions(self) -> bool:
+    async def _update_tracked_regions(self, refresh: bool = False) -> bool:
         """
         Update the capture regions for all tracked windows.
 
+        ``refresh`` discards the cached window list first; the periodic
+        update passes it so bounds never lag behind by more than one tick.
+
         Returns
         -------
         bool
@@ -542,6 +790,12 @@ class Screen(Observer):
 
         async with self._current_region_lock:
             any_window_open = False
+            if refresh:
+                _invalidate_onscreen_windows()
+            # Both window lists are fetched on first use and shared by every
+            # tracked window; manual regions need no lookup at all.
+            snapshot = None
+            existing_ids = None
 
             for tracked in self._tracked_windows:
                 # Skip manually drawn regions (no window ID) - they're always "open"
@@ -549,27 +803,36 @@ class Screen(Observer):
                     any_window_open = True
                     continue
 
-                # First check if window exists at all (closed vs minimized/hidden)
-                window_exists = await self._run_in_thread(
-                    _window_exists, tracked["id"]
-                )
-
-                if not window_exists:
-                    # Window is actually closed - mark as closed
-                    tracked["region"] = None
-                    logging.getLogger("Screen").warning(
-                        f"Tracked window (ID: {tracked['id']}) closed - removed from tracking"
-                    )
-                    continue
+                if snapshot is None:
+                    snapshot = await self._run_in_thread(_onscreen_snapshot)
+
+                # On-screen windows exist by definition; only the others need
+                # the full window list to tell closed from minimized/hidden.
+                if tracked["id"] not in snapshot.by_id:
+                    if existing_ids is None:
+                        existing_ids = await self._run_in_thread(_existing_window_ids)
+                    if tracked["id"] not in existing_ids:
+                        # Window is actually closed - mark as closed
+                        tracked["region"] = None
+                        logging.getLogger("Screen").warning(
+                            f"Tracked window (ID: {tracked['id']}) closed - removed from tracking"
+                        )
+                        continue
 
                 # Window exists but may not be visible (minimized, different Space, etc.)
                 any_window_open = True
 
                 # Try to get visible bounds and owner
                 new_region, new_owner = await self._run_in_thread(
-                    _get_window_bounds_by_id, tracked["id"]
+                    _get_window_bounds_by_id, tracked["id"], snapshot
                 )
 
+                if new_region == tracked["region"] and (
+                    not new_owner or new_owner == tracked.get("owner")
+                ):
+                    # Window has not moved or resized - nothing to update
+                    continue
+
                 if new_region:
                     # Update owner if it changed
                     if new_owner:
@@ -601,14 +864,21 @@ class Screen(Observer):
 
             return any_window_open
 
-    def _is_point_in_region(self, x: float, y: float, region: dict) -> bool:
-        """Check if a point (in global coordinates) is inside a region."""
+    def _is_point_in_region(
+        self, x: float, y: float, region: dict, gmax_y: Optional[float] = None
+    ) -> bool:
+        """Check if a point (in global coordinates) is inside a region.
+
+        ``gmax_y`` lets callers testing several regions look up the global
+        bounds once.
+        """
         x_min = region["left"]
         x_max = region["left"] + region["width"]
         y_min = region["top"]
         y_max = region["top"] + region["height"]
 
-        _, _, _, gmax_y = _get_global_bounds()
+        if gmax_y is None:
+            _, _, _, gmax_y = _get_global_bounds()
         quartz_y = gmax_y - y
 
         x_check = x_min <= x < x_max
@@ -623,66 +893,48 @@ class Screen(Observer):
 
         return x_check and y_check
 
-    def _get_topmost_window_at_point(self, x: float, y: float) -> Optional[tuple[int, str]]:
+    def _get_topmost_window_at_point(
+        self, x: float, y: float, snapshot: Optional[_WindowSnapshot] = None
+    ) -> Optional[tuple[int, str]]:
         """Get the window ID and owner of the topmost window at the given point.
 
         Parameters:
         - x, y: Screen coordinates (Y=0 at top)
+        - snapshot: window snapshot to search; the cached one by default
 
         Returns tuple of (window_id, owner_name) or (None, None) if none found.
         """
-        import Quartz
+        # ALL on-screen windows in front-to-back Z-order
+        if snapshot is None:
+            snapshot = _onscreen_snapshot()
+        menubar_level = _menubar_level()
 
-        # Get ALL on-screen windows in front-to-back Z-order
-        opts = Quartz.kCGWindowListOptionOnScreenOnly
-        wins = Quartz.CGWindowListCopyWindowInfo(opts, Quartz.kCGNullWindowID)
-
-        if not wins:
-            return None, None
-        
         # Find topmost non-system window at this point
-        for win in wins:
-            bounds = win.get("kCGWindowBounds", {})
-            if not bounds:
-                continue
-
-            wx, wy, ww, wh = (
-                bounds.get("X", 0),
-                bounds.get("Y", 0),
-                bounds.get("Width", 0),
-                bounds.get("Height", 0),
-            )
-
+        for x0, y0, x1, y1, window_id, owner, layer in snapshot.rects:
             if self.debug:
                 log = logging.getLogger("Screen")
-                log.debug(f"Window bounds: x=[{wx}, {wx+ww}], y=[{wy}, {wy+wh}]")
-                log.debug(f"Window owner: {win.get('kCGWindowOwnerName', 'Unknown')}")
-                log.debug(f"Window id: {win.get('kCGWindowNumber')}")
-
-            # Compare with screen coordinates
-            x_match = wx <= x <= wx + ww
-            y_match = wy <= y <= wy + wh
+                log.debug(f"Window bounds: x=[{x0}, {x1}], y=[{y0}, {y1}]")
+                log.debug(f"Window owner: {owner}")
+                log.debug(f"Window id: {window_id}")
 
-            if x_match and y_match:
-                window_id = win.get("kCGWindowNumber")
-                owner = win.get("kCGWindowOwnerName", "Unknown")
-                layer = win.get("kCGWindowLayer", 0)
+            if not (x0 <= x <= x1 and y0 <= y <= y1):
+                continue
 
-                # Skip system UI elements
-                is_menubar = layer == Quartz.CGWindowLevelForKey(Quartz.kCGMainMenuWindowLevelKey)
-                is_system = owner in ("Dock", "WindowServer", "Window Server")
+            # Skip system UI elements
+            is_menubar = layer == menubar_level
+            is_system = owner in _SYSTEM_OWNERS
 
-                if not is_system and not is_menubar:
-                    if self.debug:
-                        logging.getLogger("Screen").debug(
-                            f"Topmost window: owner='{owner}', id={window_id}"
-                        )
-                    return window_id, owner
-                else:
-                    if self.debug:
-                        logging.getLogger("Screen").debug(
-                            f"Skipping window (is_system={is_system}, is_menubar={is_menubar})"
-                        )
+            if not is_system and not is_menubar:
+                if self.debug:
+                    logging.getLogger("Screen").debug(
+                        f"Topmost window: owner='{owner}', id={window_id}"
+                    )
+                return window_id, owner
+            else:
+                if self.debug:
+                    logging.getLogger("Screen").debug(
+                        f"Skipping window (is_system={is_system}, is_menubar={is_menubar})"
+                    )
 
         if self.debug:
             logging.getLogger("Screen").debug("No non-system window found at point")
@@ -696,11 +948,12 @@ class Screen(Observer):
         For tracked windows (not manual regions), this verifies that the topmost window
         belongs to the same app (owner) as the tracked window.
         """
+        _, _, _, gmax_y = _get_global_bounds()
         for tracked in self._tracked_windows:
             # Skip windows that have been closed (region is None)
             if tracked["region"] is None:
                 continue
-            if self._is_point_in_region(x, y, tracked["region"]):
+            if self._is_point_in_region(x, y, tracked["region"], gmax_y):
                 if self.debug:
                     logging.getLogger("Screen").debug("Point is within region bounds")
                 # If this is a tracked window (has window_id), verify owner matches
@@ -736,6 +989,13 @@ class Screen(Observer):
         async with self._inactivity_lock:
             self._last_activity_time = time.time()
 
+    async def _global_bounds(self) -> tuple[float, float, float, float]:
+        """Global display bounds, off-loading to a thread only to re-query."""
+        bounds = _fresh_global_bounds()
+        if bounds is None:
+            bounds = await self._run_in_thread(_get_global_bounds)
+        return bounds
+
     async def _run_in_thread(self, func, *args, **kwargs):
         """Run a function in the custom thread pool."""
         loop = asyncio.get_running_loop()
@@ -743,14 +1003,23 @@ class Screen(Observer):
             self._thread_pool, lambda: func(*args, **kwargs)
         )
 
+    def _get_sct(self) -> mss.base.MSSBase:
+        """Return the observer's mss instance, creating it on first use.
+
+        One instance serves region setup, DPI detection and every capture;
+        mss serialises ``grab`` calls on an instance with its own lock.
+        """
+        if self._sct is None:
+            self._sct = mss.mss()
+        return self._sct
+
     def _detect_high_dpi(self) -> bool:
         """Detect if running on a high-DPI display and adjust settings."""
         try:
             # Check if any monitor has high resolution (likely Retina)
-            with mss.mss() as sct:
-                for monitor in sct.monitors[1:]:  # Skip monitor 0 (all monitors)
-                    if monitor["width"] > 2560 or monitor["height"] > 1600:
-                        return True
+            for monitor in self._get_sct().monitors[1:]:  # Skip monitor 0 (all monitors)
+                if monitor["width"] > 2560 or monitor["height"] > 1600:
+                    return True
         except Exception:
             pass
         return False
@@ -761,7 +1030,7 @@ class Screen(Observer):
 
         Returns True if the scroll event should be logged, False otherwise.
         """
-        current_time = time.time()
+        current_time = time.monotonic()
 
         # Check if this is a new scroll session
         if (
@@ -783,11 +1052,9 @@ class Screen(Observer):
             return False
 
         # Check minimum distance
-        if self._scroll_last_position is not None:
-            distance = (
-                (x - self._scroll_last_position[0]) ** 2
-                + (y - self._scroll_last_position[1]) ** 2
-            ) ** 0.5
+        last_position = self._scroll_last_position
+        if last_position is not None:
+            distance = math.hypot(x - last_position[0], y - last_position[1])
             if distance < self._scroll_min_distance:
                 return False
 
@@ -818,13 +1085,36 @@ class Screen(Observer):
 
         NOTE: Cleanup is disabled (_MAX_SCREENSHOT_AGE is None) - all screenshots are kept.
         """
-        # Pruning disabled - keep all screenshots
-        return
+        if self._MAX_SCREENSHOT_AGE is None:
+            # Pruning disabled - keep all screenshots
+            return
+
+        cutoff = time.time() - self._MAX_SCREENSHOT_AGE
+
+        def _prune() -> int:
+            # One scandir pass in one worker hop; DirEntry.stat() reuses the
+            # directory read instead of a separate getmtime per file.
+            removed = 0
+            with os.scandir(self.screens_dir) as entries:
+                for entry in entries:
+                    if not entry.name.endswith(".jpg"):
+                        continue
+                    try:
+                        if entry.stat(follow_symlinks=False).st_mtime < cutoff:
+                            os.remove(entry.path)
+                            removed += 1
+                    except OSError:
+                        pass
+            return removed
+
+        removed = await self._run_in_thread(_prune)
+        if removed and self.debug:
+            logging.getLogger("Screen").info(f"Removed {removed} old screenshots")
 
     # ─────────────────────────────── I/O helpers
     def _initialize_gdrive_client(self) -> None:
         """Set up the Google Drive client and ensure the target folder exists."""
-        drive = initialize_google_drive(self._client_secrets_path)
+        drive = get_drive(self._client_secrets_path)
         folder_id = self._ensure_drive_folder(drive, self._gdrive_dir)
         self._drive_client = drive
         self._drive_folder_id = folder_id
@@ -871,6 +1161,31 @@ class Screen(Observer):
             )
         return folder["id"]
 
+    def _upload_blocking(self, path: str) -> None:
+        """Upload *path* from an upload-pool thread, retrying with backoff."""
+        for attempt in range(self._UPLOAD_ATTEMPTS):
+            try:
+                upload_file(
+                    path,
+                    self._drive_folder_id,
+                    self._drive_client,
+                    delete_local=True,
+                )
+                return
+            except Exception:
+                if attempt == self._UPLOAD_ATTEMPTS - 1:
+                    raise
+                time.sleep(2**attempt)
+
+    async def _upload_worker(self) -> None:
+        """Drain the upload queue until cancelled."""
+        while True:
+            path = await self._upload_queue.get()
+            try:
+                await self._upload_to_drive(path)
+            finally:
+                self._upload_queue.task_done()
+
     async def _upload_to_drive(self, path: str) -> None:
         """Upload the given screenshot to Google Drive asynchronously.
 
@@ -882,20 +1197,25 @@ class Screen(Observer):
 
         # Lazy initialization of Google Drive client on first upload
         # This will reuse the cached credentials created during CLI authentication
-        if self._drive_client is None or self._drive_folder_id is None:
-            try:
-                await self._run_in_thread(self._initialize_gdrive_client)
-                if self.debug:
-                    logging.getLogger("Screen").info(
-                        "Google Drive uploads enabled (folder id: %s)",
-                        self._drive_folder_id,
-                    )
-            except Exception as exc:
-                logging.getLogger("Screen").error(
-                    "Failed to initialize Google Drive uploads: %s", exc, exc_info=self.debug
-                )
-                self._gdrive_setup_failed = True
+        async with self._gdrive_init_lock:
+            if self._gdrive_setup_failed:
                 return
+            if self._drive_client is None or self._drive_folder_id is None:
+                try:
+                    await asyncio.get_running_loop().run_in_executor(
+                        self._upload_pool, self._initialize_gdrive_client
+                    )
+                    if self.debug:
+                        logging.getLogger("Screen").info(
+                            "Google Drive uploads enabled (folder id: %s)",
+                            self._drive_folder_id,
+                        )
+                except Exception as exc:
+                    logging.getLogger("Screen").error(
+                        "Failed to initialize Google Drive uploads: %s", exc, exc_info=self.debug
+                    )
+                    self._gdrive_setup_failed = True
+                    return
 
         if not os.path.exists(path):
             if self.debug:
@@ -905,12 +1225,8 @@ class Screen(Observer):
             return
 
         try:
-            await self._run_in_thread(
-                upload_file,
-                path,
-                self._drive_folder_id,
-                self._drive_client,
-                delete_local=True,
+            await asyncio.get_running_loop().run_in_executor(
+                self._upload_pool, self._upload_blocking, path
             )
         except Exception as exc:
             logging.getLogger("Screen").error(
@@ -933,6 +1249,9 @@ class Screen(Observer):
         """
         Save a frame with bounding box and crosshair at the given position.
 
+        The frame is queued for the encode workers and the destination path
+        is returned immediately; the file appears once the JPEG is written.
+
         Parameters
         ----------
         frame : mss frame object
@@ -950,15 +1269,148 @@ class Screen(Observer):
         box_width : int
             Width of bounding box outline
         """
+        paths = await self._save_frames(
+            [frame], monitor_rect, x, y, (tag,), highlight, box_color, box_width
+        )
+        return paths[0]
+
+    async def _save_frames(
+        self,
+        frames: list,
+        monitor_rect: dict,
+        x,
+        y,
+        tags: tuple[str, ...],
+        highlight: bool = True,
+        box_color: str = "red",
+        box_width: int = 10,
+    ) -> list[str]:
+        """Like :meth:`_save_frame`, but for consecutive frames of one region.
+
+        ``frames[i]`` is saved under ``tags[i]`` as a single encode job.  A
+        frame byte-identical to the one before it is not encoded again; its
+        path becomes a hard link to that JPEG.
+        """
         ts = f"{time.time():.5f}"
-        path = os.path.join(self.screens_dir, f"{ts}_{tag}.jpg")
-        image = Image.frombytes("RGB", (frame.width, frame.height), frame.rgb)
+        paths = [os.path.join(self.screens_dir, f"{ts}_{tag}.jpg") for tag in tags]
+        written = asyncio.get_running_loop().create_future()
+        for path in paths:
+            self._pending_writes[path] = written
+        await self._encode_queue.put(
+            (frames, monitor_rect, x, y, paths, highlight, box_color, box_width)
+        )
+        return paths
+
+    async def _encode_worker(self) -> None:
+        """Drain the encode queue until cancelled."""
+        loop = asyncio.get_running_loop()
+        while True:
+            job = await self._encode_queue.get()
+            paths = job[4]
+            try:
+                await loop.run_in_executor(self._encode_pool, self._encode_frames, *job)
+            except Exception as exc:
+                logging.getLogger("Screen").error(
+                    "Failed to write screenshot '%s': %s", paths[0], exc, exc_info=self.debug
+                )
+            else:
+                # Release waiters before possibly blocking on a full upload queue
+                self._finish_writes(paths)
+                if self.upload_to_gdrive and not self._gdrive_setup_failed:
+                    for path in paths:
+                        await self._upload_queue.put(path)
+            finally:
+                self._finish_writes(paths)
+                self._encode_queue.task_done()
+
+    def _finish_writes(self, paths: list[str]) -> None:
+        """Mark the queued write of *paths* as finished."""
+        for path in paths:
+            written = self._pending_writes.pop(path, None)
+            if written is not None and not written.done():
+                written.set_result(None)
+
+    def unflushed_files(self) -> list[str]:
+        """Screenshots not yet written (or, when uploading, not yet uploaded).
+
+        Safe to call from another thread once the event loop has stalled,
+        e.g. after shutdown timed out.
+        """
+        paths = list(self._pending_writes.copy())
+        if self.upload_to_gdrive:
+            # Uploaded files are deleted locally, so whatever is left is unsent.
+            try:
+                with os.scandir(self.screens_dir) as entries:
+                    paths.extend(
+                        e.path for e in entries
+                        if e.name.endswith(".jpg") and e.path not in paths
+                    )
+            except OSError:
+                pass
+        return sorted(paths)
+
+    async def _wait_written(self, path: str) -> None:
+        """Wait until the JPEG queued for *path* has been written (or failed)."""
+        written = self._pending_writes.get(path)
+        if written is not None:
+            await written
+
+    def _encode_frames(
+        self,
+        frames: list,
+        monitor_rect: dict,
+        x,
+        y,
+        paths: list[str],
+        highlight: bool,
+        box_color: str,
+        box_width: int,
+    ) -> None:
+        """Write one encode job's frames (runs on the encode pool)."""
+        prev_frame = prev_path = None
+        for frame, path in zip(frames, paths):
+            # Unchanged screen (e.g. a click with no visible effect): the
+            # annotated image would be identical, so link instead of encoding.
+            # Comparing here keeps the multi-MB memcmp off the event loop.
+            if (
+                prev_frame is not None
+                and frame.size == prev_frame.size
+                and frame.raw == prev_frame.raw
+            ):
+                try:
+                    os.link(prev_path, path)
+                except OSError:
+                    shutil.copyfile(prev_path, path)
+            else:
+                self._encode_frame(
+                    frame, monitor_rect, x, y, path, highlight, box_color, box_width
+                )
+            prev_frame, prev_path = frame, path
+
+    def _encode_frame(
+        self,
+        frame,
+        monitor_rect: dict,
+        x,
+        y,
+        path: str,
+        highlight: bool,
+        box_color: str,
+        box_width: int,
+    ) -> None:
+        """Decode, annotate and write one frame as JPEG (runs on the encode pool)."""
+        # Decode the BGRA capture straight into RGB instead of going through
+        # frame.rgb, which builds an intermediate copy in Python first.
+        image = Image.frombuffer(
+            "RGB", (frame.width, frame.height), frame.raw, "raw", "BGRX", 0, 1
+        )
         draw = ImageDraw.Draw(image)
 
-        # # Compute actual scale factor from frame vs monitor dimensions
-        # # This handles any DPI (1.0x, 1.5x, 2.0x, 2.5x, etc.) correctly
-        scale_x = frame.width / monitor_rect["width"]
-        scale_y = frame.height / monitor_rect["height"]
+        scale_x, scale_y, box_size, crosshair_size, crosshair_width = (
+            _overlay_geometry(
+                frame.width, frame.height, monitor_rect["width"], monitor_rect["height"]
+            )
+        )
 
         if self.debug:
             log = logging.getLogger("Screen")
@@ -978,9 +1430,6 @@ class Screen(Observer):
 
         if highlight:
             # Calculate bounding box with smaller, more precise padding
-            # Use average scale for box size to handle non-uniform scaling
-            avg_scale = (scale_x + scale_y) / 2.0
-            box_size = int(30 * avg_scale)  # 30 logical points
             x1 = max(0, x_pixel - box_size)
             x2 = min(frame.width, x_pixel + box_size)
             y1 = max(0, y_pixel - box_size)
@@ -991,9 +1440,6 @@ class Screen(Observer):
                 draw.rectangle([x1, y1, x2, y2], outline=box_color, width=box_width)
 
             # Draw a crosshair at the exact mouse position
-            crosshair_size = int(15 * avg_scale)  # 15 logical points
-            crosshair_width = max(2, int(3 * avg_scale))
-
             # Horizontal line
             h_x1 = max(0, x_pixel - crosshair_size)
             h_x2 = min(frame.width, x_pixel + crosshair_size)
@@ -1009,24 +1455,13 @@ class Screen(Observer):
             )
 
         # Save with lower quality to reduce memory usage and disk I/O
-        await self._run_in_thread(
-            image.save,
-            path,
-            "JPEG",
-            quality=50,  # Reduced to 50 for better performance
-            optimize=True,  # Enable optimization
+        image.save(
+            path, "JPEG", quality=self._JPEG_QUALITY, optimize=self._JPEG_OPTIMIZE
         )
 
-        # Explicitly delete image objects to free memory
+        # Release the decoded pixels now rather than waiting on the collector
         del draw
-        del image
-
-        if self.upload_to_gdrive and not self._gdrive_setup_failed:
-            task = asyncio.create_task(self._upload_to_drive(path))
-            task.add_done_callback(lambda t: self._gdrive_tasks.discard(t))
-            self._gdrive_tasks.add(task)
-
-        return path
+        image.close()
 
     async def _process_and_emit(
         self,
@@ -1039,18 +1474,61 @@ class Screen(Observer):
             # Include scroll delta information
             scroll_info = ev.get("scroll", (0, 0))
             step = f"scroll({ev['position'][0]:.1f}, {ev['position'][1]:.1f}, dx={scroll_info[0]:.2f}, dy={scroll_info[1]:.2f})"
-            await self.update_queue.put(Update(content=step, content_type="input_text"))
+            self.update_queue.put_nowait(Update(content=step, content_type="input_text"))
         elif "click" in action:
             step = f"{action}({ev['position'][0]:.1f}, {ev['position'][1]:.1f})"
-            await self.update_queue.put(Update(content=step, content_type="input_text"))
+            self.update_queue.put_nowait(Update(content=step, content_type="input_text"))
         else:
             step = f"{action}({ev['text']})"
-            await self.update_queue.put(Update(content=step, content_type="input_text"))
+            self.update_queue.put_nowait(Update(content=step, content_type="input_text"))
+
+    # ─────────────────────────────── listener → event loop hand-off
+    def _post_event(self, handler, *args) -> None:
+        """Queue a handler call from a listener thread."""
+        with self._event_ring_lock:
+            self._event_ring.append((handler, args))
+            wake = self._dispatch_idle
+            self._dispatch_idle = False
+        if wake:
+            try:
+                self._loop.call_soon_threadsafe(self._event_wakeup.set)
+            except RuntimeError:
+                pass  # event loop already closed
+
+    async def _dispatch_events(self) -> None:
+        """Start a handler task for every queued listener event, in order."""
+        while True:
+            await self._event_wakeup.wait()
+            self._event_wakeup.clear()
+            while True:
+                with self._event_ring_lock:
+                    if not self._event_ring:
+                        self._dispatch_idle = True
+                        break
+                    handler, args = self._event_ring.popleft()
+                task = asyncio.create_task(handler(*args))
+                self._event_tasks.add(task)
+                task.add_done_callback(self._event_tasks.discard)
 
     async def stop(self) -> None:
         """Stop the observer and clean up resources."""
         await super().stop()
 
+        if self._dispatch_task is not None:
+            self._dispatch_task.cancel()
+            await asyncio.gather(self._dispatch_task, return_exceptions=True)
+            self._dispatch_task = None
+
+        # In-flight handlers may still queue screenshots; let them finish
+        # while the encode workers are alive to consume them.
+        if self._event_tasks:
+            await asyncio.gather(*self._event_tasks, return_exceptions=True)
+
+        # Nothing grabs any more; release the shared mss instance
+        if self._sct is not None:
+            self._sct.close()
+            self._sct = None
+
         # Clean up frame objects
         async with self._frame_lock:
             for frame in self._frames.values():
@@ -1058,16 +1536,26 @@ class Screen(Observer):
                     del frame
             self._frames.clear()
 
-        # Force garbage collection
-        if self._gdrive_tasks:
-            await asyncio.gather(*list(self._gdrive_tasks), return_exceptions=True)
-            self._gdrive_tasks.clear()
-
-        await self._run_in_thread(gc.collect)
-
-        # Shutdown thread pool
+        # Let queued screenshots and uploads finish before tearing down workers
+        if self._encode_tasks:
+            await self._encode_queue.join()
+            for task in self._encode_tasks:
+                task.cancel()
+            await asyncio.gather(*self._encode_tasks, return_exceptions=True)
+            self._encode_tasks.clear()
+        if self._upload_tasks:
+            await self._upload_queue.join()
+            for task in self._upload_tasks:
+                task.cancel()
+            await asyncio.gather(*self._upload_tasks, return_exceptions=True)
+            self._upload_tasks.clear()
+
+        # Shutdown thread pools
         if hasattr(self, "_thread_pool"):
             self._thread_pool.shutdown(wait=True)
+        self._encode_pool.shutdown(wait=True)
+        if self._upload_pool is not None:
+            self._upload_pool.shutdown(wait=True)
 
     # ─────────────────────────────── main thread listener methods (macOS-safe)
     def run_listeners_on_main_thread(self):
@@ -1089,7 +1577,6 @@ class Screen(Observer):
         self._listeners_started = True
 
         # Start mouse listener in background thread
-        import threading
         mouse_thread = threading.Thread(
             target=self._mouse_listener.run,
             daemon=True,
@@ -1143,454 +1630,461 @@ class Screen(Observer):
         loop = asyncio.get_running_loop()
         self._loop = loop  # Set loop reference for listener callbacks
 
+        if not self._encode_tasks:
+            self._encode_tasks = [
+                asyncio.create_task(self._encode_worker())
+                for _ in range(self._ENCODE_WORKERS)
+            ]
+        if self.upload_to_gdrive and not self._upload_tasks:
+            self._upload_tasks = [
+                asyncio.create_task(self._upload_worker())
+                for _ in range(self._UPLOAD_WORKERS)
+            ]
+
         key_event_count = 0
+        # Only used to read the pointer position; one instance serves every key
+        mouse_ctrl = mouse.Controller()
 
         # ------------------------------------------------------------------
         # All calls to mss / Quartz are wrapped in `to_thread`
         # ------------------------------------------------------------------
-        with mss.mss() as sct:
-            # Initialize mons list - will be updated dynamically for tracked windows
-            if self._tracked_windows:
-                # Use the tracked windows/regions
-                if self.debug:
-                    log.info(
-                        f"Recording {len(self._tracked_windows)} window(s)/region(s)"
-                    )
-            else:
-                # Use all monitors (backward compatibility)
-                if self.debug:
-                    log.info(f"Recording all monitors")
-
-            # Create and start listeners if not using main thread mode
-            if not self._start_listeners_on_main_thread:
-                if not self._listeners_started:
-                    self._mouse_listener = self._mouse_listener_factory()
-                    self._key_listener = self._key_listener_factory()
-
-                    # Brief delay to let AppKit modal state settle after window selection
-                    await asyncio.sleep(0.1)
+        # Shared with region setup; closed once in stop(), after in-flight
+        # handlers (which grab from it) have finished.
+        sct = self._get_sct()
+        # Initialize mons list - will be updated dynamically for tracked windows
+        if self._tracked_windows:
+            # Use the tracked windows/regions
+            if self.debug:
+                log.info(
+                    f"Recording {len(self._tracked_windows)} window(s)/region(s)"
+                )
+        else:
+            # Use all monitors (backward compatibility)
+            if self.debug:
+                log.info(f"Recording all monitors")
 
-                    self._mouse_listener.start()
-                    self._key_listener.start()
-                    self._listeners_started = True
+        # Create and start listeners if not using main thread mode
+        if not self._start_listeners_on_main_thread:
+            if not self._listeners_started:
+                self._mouse_listener = self._mouse_listener_factory()
+                self._key_listener = self._key_listener_factory()
 
-            # Wait for listeners to be started (might be on main thread)
-            wait_time = 0
-            while not self._listeners_started and wait_time < 10:
+                # Brief delay to let AppKit modal state settle after window selection
                 await asyncio.sleep(0.1)
-                wait_time += 0.1
 
-            if not self._listeners_started:
-                log.error("Listeners not started after 10 seconds")
-                return
+                self._mouse_listener.start()
+                self._key_listener.start()
+                self._listeners_started = True
 
-            mouse_listener = self._mouse_listener
-            key_listener = self._key_listener
+        # Wait for listeners to be started (might be on main thread)
+        wait_time = 0
+        while not self._listeners_started and wait_time < 10:
+            await asyncio.sleep(0.1)
+            wait_time += 0.1
 
-            # ---- nested helper inside the async context ----
-            async def flush():
-                if self._pending_event is None:
-                    return
-                if self._skip():
-                    self._pending_event = None
-                    return
+        if not self._listeners_started:
+            log.error("Listeners not started after 10 seconds")
+            return
+
+        mouse_listener = self._mouse_listener
+        key_listener = self._key_listener
 
-                ev = self._pending_event
-                # Clear pending event immediately to avoid blocking next event
+        # ---- nested helper inside the async context ----
+        async def flush():
+            if self._pending_event is None:
+                return
+            if self._skip():
                 self._pending_event = None
+                return
 
-                # Update tracked regions before capturing "after" frame
-                await self._update_tracked_regions()
+            ev = self._pending_event
+            # Clear pending event immediately to avoid blocking next event
+            self._pending_event = None
 
-                # Use the region from the event for capturing the "after" frame
-                mon_rect = ev["monitor_rect"]
-                if mon_rect is None:
-                    if self.debug:
-                        logging.getLogger("Screen").warning(
-                            "Monitor region not available"
-                        )
-                    return
+            # Update tracked regions before capturing "after" frame
+            await self._update_tracked_regions()
 
-                # Convert screen coordinates to mss coordinates
-                mss_rect = self._screen_to_mss_coords(mon_rect)
-                try:
-                    aft = await self._run_in_thread(sct.grab, mss_rect)
-                except Exception as e:
-                    if self.debug:
-                        logging.getLogger("Screen").error(
-                            f"Failed to capture after frame: {e}"
-                        )
-                    return
+            # Use the region from the event for capturing the "after" frame
+            mon_rect = ev["monitor_rect"]
+            if mon_rect is None:
+                if self.debug:
+                    logging.getLogger("Screen").warning(
+                        "Monitor region not available"
+                    )
+                return
 
-                if "scroll" in ev["type"]:
-                    scroll_info = ev.get("scroll", (0, 0))
-                    step = f"scroll({ev['position'][0]:.1f}, {ev['position'][1]:.1f}, dx={scroll_info[0]:.2f}, dy={scroll_info[1]:.2f})"
-                else:
-                    step = f"{ev['type']}({ev['position'][0]:.1f}, {ev['position'][1]:.1f})"
-
-                bef_path = await self._save_frame(
-                    ev["before"],
-                    ev["monitor_rect"],
-                    ev["position"][0],
-                    ev["position"][1],
-                    f"{step}_before",
-                )
-                aft_path = await self._save_frame(
-                    aft, mon_rect, ev["position"][0], ev["position"][1], f"{step}_after"
-                )
-                await self._process_and_emit(bef_path, aft_path, ev["type"], ev)
+            # Convert screen coordinates to mss coordinates
+            mss_rect = self._screen_to_mss_coords(mon_rect)
+            try:
+                aft = await self._run_in_thread(sct.grab, mss_rect)
+            except Exception as e:
+                if self.debug:
+                    logging.getLogger("Screen").error(
+                        f"Failed to capture after frame: {e}"
+                    )
+                return
 
-                log.info(f"{ev['type']} captured on window {ev['mon']}")
+            if "scroll" in ev["type"]:
+                scroll_info = ev.get("scroll", (0, 0))
+                step = f"scroll({ev['position'][0]:.1f}, {ev['position'][1]:.1f}, dx={scroll_info[0]:.2f}, dy={scroll_info[1]:.2f})"
+            else:
+                step = f"{ev['type']}({ev['position'][0]:.1f}, {ev['position'][1]:.1f})"
+
+            # One job for the pair, so the encoder can link an unchanged
+            # "after" frame to the "before" JPEG instead of re-encoding it
+            bef_path, aft_path = await self._save_frames(
+                [ev["before"], aft],
+                mon_rect,
+                ev["position"][0],
+                ev["position"][1],
+                (f"{step}_before", f"{step}_after"),
+            )
+            await self._process_and_emit(bef_path, aft_path, ev["type"], ev)
 
-            # ---- mouse event reception ----
-            async def _handle_mouse_event(x: float, y: float, typ: str):
-                try:
-                    base, phase = typ.rsplit("_", 1)
-                except ValueError:
-                    if self.debug:
-                        log.info(f"Ignoring mouse event '{typ}' without phase suffix")
-                    return
+            log.info(f"{ev['type']} captured on window {ev['mon']}")
+
+        # ---- mouse event reception ----
+        async def _handle_mouse_event(x: float, y: float, typ: str):
+            try:
+                base, phase = typ.rsplit("_", 1)
+            except ValueError:
+                if self.debug:
+                    log.info(f"Ignoring mouse event '{typ}' without phase suffix")
+                return
 
-                if phase not in {"down", "up"}:
+            if phase not in {"down", "up"}:
+                return
+
+            if phase == "up":
+                if self._pending_event is None:
                     return
 
-                if phase == "up":
-                    if self._pending_event is None:
-                        return
+                async def delayed_flush():
+                    await asyncio.sleep(self._after_delay)
+                    await flush()
 
-                    async def delayed_flush():
-                        await asyncio.sleep(self._after_delay)
-                        await flush()
+                asyncio.create_task(delayed_flush())
+                return
 
-                    asyncio.create_task(delayed_flush())
-                    return
+            # pynput returns screen coordinates (Y=0 at top), no conversion needed
+            _, _, _, gmax_y = await self._global_bounds()
+            screen_y = gmax_y - y
 
-                # pynput returns screen coordinates (Y=0 at top), no conversion needed
-                _, _, _, gmax_y = await self._run_in_thread(_get_global_bounds)
-                screen_y = gmax_y - y
+            if self.debug:
+                logging.getLogger("Screen").debug(
+                    "Mouse event raw coords: (%.1f, %.1f)", x, y
+                )
 
+            # Check if point is in any of our tracked windows/regions
+            tracked = self._find_region_for_point(x, screen_y)
+            if tracked is None:
                 if self.debug:
-                    logging.getLogger("Screen").debug(
-                        "Mouse event raw coords: (%.1f, %.1f)", x, y
+                    log.info(
+                        f"{typ:<6} @({x:7.1f},{screen_y:7.1f}) outside tracked window(s), skipping"
                     )
+                return
 
-                # Check if point is in any of our tracked windows/regions
-                tracked = self._find_region_for_point(x, screen_y)
-                if tracked is None:
-                    if self.debug:
-                        log.info(
-                            f"{typ:<6} @({x:7.1f},{screen_y:7.1f}) outside tracked window(s), skipping"
-                        )
-                    return
-
-                # Update regions for tracked windows
-                if tracked["id"] is not None:
-                    await self._update_tracked_regions()
+            # Update regions for tracked windows
+            if tracked["id"] is not None:
+                await self._update_tracked_regions()
 
-                mon = tracked["region"]
+            mon = tracked["region"]
 
-                idx = self._tracked_windows.index(tracked) + 1  # 1-indexed for display
+            idx = tracked["idx"]
 
-                # Grab FRESH "before" frame using current window rect
-                # Convert screen coordinates to mss coordinates
-                mss_mon = self._screen_to_mss_coords(mon)
-                try:
-                    bf = await self._run_in_thread(sct.grab, mss_mon)
-                except Exception as e:
-                    if self.debug:
-                        log.error(f"Failed to capture before frame: {e}")
-                    return
+            # Grab FRESH "before" frame using current window rect
+            # Convert screen coordinates to mss coordinates
+            mss_mon = self._screen_to_mss_coords(mon)
+            try:
+                bf = await self._run_in_thread(sct.grab, mss_mon)
+            except Exception as e:
+                if self.debug:
+                    log.error(f"Failed to capture before frame: {e}")
+                return
 
-                if self._skip():
-                    return
+            if self._skip():
+                return
 
-                # Update activity timestamp
-                await self._update_activity_time()
+            # Update activity timestamp
+            await self._update_activity_time()
 
-                rel_x = x - mon["left"]
-                rel_y = mon["top"] + mon["height"] - screen_y
-                log.info(
-                    f"{typ:<6} @({rel_x:7.1f},{rel_y:7.1f}) → win={idx}"
-                )
-                self._pending_event = {
-                    "type": base,
-                    "position": (rel_x, rel_y),
-                    "mon": idx,
-                    "before": bf,
-                    "monitor_rect": mon,
-                }
-                return
+            rel_x = x - mon["left"]
+            rel_y = mon["top"] + mon["height"] - screen_y
+            log.info(
+                f"{typ:<6} @({rel_x:7.1f},{rel_y:7.1f}) → win={idx}"
+            )
+            self._pending_event = {
+                "type": base,
+                "position": (rel_x, rel_y),
+                "mon": idx,
+                "before": bf,
+                "monitor_rect": mon,
+            }
+            return
 
-            # ---- keyboard event reception ----
-            async def _handle_key_event(key, typ: str):
-                # Get current mouse position to determine active window
-                x, y = mouse.Controller().position
+        # ---- keyboard event reception ----
+        async def _handle_key_event(key, typ: str):
+            # Get current mouse position to determine active window
+            x, y = mouse_ctrl.position
 
-                # pynput already returns Y=0 at top, no conversion needed
-                _, _, _, gmax_y = await self._run_in_thread(_get_global_bounds)
-                screen_y = gmax_y - y
+            # pynput already returns Y=0 at top, no conversion needed
+            _, _, _, gmax_y = await self._global_bounds()
+            screen_y = gmax_y - y
 
-                # Check if point is in any of our tracked windows/regions
-                tracked = self._find_region_for_point(x, screen_y)
-                if tracked is None:
-                    if self.debug:
-                        log.info(
-                            f"Key {typ}: {str(key)} outside tracked window(s), skipping"
-                        )
-                    return
+            # Check if point is in any of our tracked windows/regions
+            tracked = self._find_region_for_point(x, screen_y)
+            if tracked is None:
+                if self.debug:
+                    log.info(
+                        f"Key {typ}: {str(key)} outside tracked window(s), skipping"
+                    )
+                return
 
-                # Update regions for tracked windows
-                if tracked["id"] is not None:
-                    await self._update_tracked_regions()
+            # Update regions for tracked windows
+            if tracked["id"] is not None:
+                await self._update_tracked_regions()
 
-                mon = tracked["region"]
-                rel_x = x
-                rel_y = screen_y - mon["height"]
-                idx = self._tracked_windows.index(tracked) + 1  # 1-indexed for display
+            mon = tracked["region"]
+            rel_x = x
+            rel_y = screen_y - mon["height"]
+            idx = tracked["idx"]
 
-                # Grab FRESH frame using current window rect
-                # Convert screen coordinates to mss coordinates
-                mss_mon = self._screen_to_mss_coords(mon)
-                try:
-                    frame = await self._run_in_thread(sct.grab, mss_mon)
-                except Exception as e:
-                    if self.debug:
-                        log.error(f"Failed to capture keyboard frame: {e}")
-                    return
+            # Grab FRESH frame using current window rect
+            # Convert screen coordinates to mss coordinates
+            mss_mon = self._screen_to_mss_coords(mon)
+            try:
+                frame = await self._run_in_thread(sct.grab, mss_mon)
+            except Exception as e:
+                if self.debug:
+                    log.error(f"Failed to capture keyboard frame: {e}")
+                return
 
-                log.info(f"Key {typ}: {str(key)} on window {idx}")
+            log.info(f"Key {typ}: {str(key)} on window {idx}")
 
-                # Update activity timestamp
-                await self._update_activity_time()
+            # Update activity timestamp
+            await self._update_activity_time()
 
-                step = f"key_{typ}({str(key)})"
-                await self.update_queue.put(
-                    Update(content=step, content_type="input_text")
-                )
+            step = f"key_{typ}({str(key)})"
+            self.update_queue.put_nowait(
+                Update(content=step, content_type="input_text")
+            )
 
-                async with self._key_activity_lock:
-                    current_time = time.time()
-
-                    # Check if this is the start of a new keyboard session
-                    if (
-                        self._key_activity_start is None
-                        or current_time - self._key_activity_start
-                        > self._key_activity_timeout
-                    ):
-                        # Start new session - save first screenshot
-                        self._key_activity_start = current_time
-                        self._key_screenshots = []
-
-                        # Save frame
-                        screenshot_path = await self._save_frame(
-                            frame, mon, rel_x, rel_y, f"{step}_first"
-                        )
-                        self._key_screenshots.append(screenshot_path)
-                        log.info(
-                            f"Started new keyboard session, saved first screenshot: {screenshot_path}"
-                        )
-                    else:
-                        # Continue existing session - save intermediate screenshot
-                        screenshot_path = await self._save_frame(
-                            frame, mon, rel_x, rel_y, f"{step}_intermediate", highlight=False
-                        )
-                        self._key_screenshots.append(screenshot_path)
-                        log.info(
-                            f"Continued keyboard session, saved intermediate screenshot: {screenshot_path}"
-                        )
+            async with self._key_activity_lock:
+                current_time = time.monotonic()
 
-                    # Schedule cleanup of previous intermediate screenshots
-                    if len(self._key_screenshots) > 2:
-                        asyncio.create_task(self._cleanup_key_screenshots())
+                # Check if this is the start of a new keyboard session
+                if (
+                    self._key_activity_start is None
+                    or current_time - self._key_activity_start
+                    > self._key_activity_timeout
+                ):
+                    # Start new session - save first screenshot
+                    self._key_activity_start = current_time
 
-            # ---- scroll event reception ----
-            async def _handle_scroll_event(x: float, y: float, dx: float, dy: float):
-                # Convert pynput coordinates (Cocoa, Y from bottom) to screen coordinates (Y from top)
-                _, _, _, gmax_y = await self._run_in_thread(_get_global_bounds)
-                screen_y = gmax_y - y
+                    # Save frame
+                    screenshot_path = await self._save_frame(
+                        frame, mon, rel_x, rel_y, f"{step}_first"
+                    )
+                    self._key_last_path = screenshot_path
+                    self._key_screenshot_count = 1
+                    log.info(
+                        f"Started new keyboard session, saved first screenshot: {screenshot_path}"
+                    )
+                else:
+                    # Continue existing session - save intermediate screenshot
+                    screenshot_path = await self._save_frame(
+                        frame, mon, rel_x, rel_y, f"{step}_intermediate", highlight=False
+                    )
+                    self._key_last_path = screenshot_path
+                    self._key_screenshot_count += 1
+                    log.info(
+                        f"Continued keyboard session, saved intermediate screenshot: {screenshot_path}"
+                    )
 
-                # Apply scroll filtering
-                async with self._scroll_lock:
-                    if not self._should_log_scroll(x, screen_y, dx, dy):
-                        if self.debug:
-                            log.info(f"Scroll filtered out: dx={dx:.2f}, dy={dy:.2f}")
-                        return
+        # ---- scroll event reception ----
+        async def _handle_scroll_event(x: float, y: float, dx: float, dy: float):
+            # Convert pynput coordinates (Cocoa, Y from bottom) to screen coordinates (Y from top)
+            _, _, _, gmax_y = await self._global_bounds()
+            screen_y = gmax_y - y
 
-                # Check if point is in any of our tracked windows/regions
-                tracked = self._find_region_for_point(x, screen_y)
-                if tracked is None:
-                    if self.debug:
-                        log.info(
-                            f"Scroll @({x:7.1f},{screen_y:7.1f}) outside tracked window(s), skipping"
-                        )
-                    return
+            # Check if point is in any of our tracked windows/regions
+            tracked = self._find_region_for_point(x, screen_y)
+            if tracked is None:
+                if self.debug:
+                    log.info(
+                        f"Scroll @({x:7.1f},{screen_y:7.1f}) outside tracked window(s), skipping"
+                    )
+                return
 
-                # Update regions for tracked windows
-                if tracked["id"] is not None:
-                    await self._update_tracked_regions()
+            # Update regions for tracked windows
+            if tracked["id"] is not None:
+                await self._update_tracked_regions()
 
-                mon = tracked["region"]
-                rel_x = x
-                rel_y = screen_y - mon["height"]
-                idx = self._tracked_windows.index(tracked) + 1  # 1-indexed for display
+            mon = tracked["region"]
+            rel_x = x
+            rel_y = screen_y - mon["height"]
+            idx = tracked["idx"]
 
-                # Grab FRESH "before" frame using current window rect
-                # Convert screen coordinates to mss coordinates
-                mss_mon = self._screen_to_mss_coords(mon)
-                try:
-                    bf = await self._run_in_thread(sct.grab, mss_mon)
-                except Exception as e:
-                    if self.debug:
-                        log.error(f"Failed to capture before frame: {e}")
-                    return
+            # Grab FRESH "before" frame using current window rect
+            # Convert screen coordinates to mss coordinates
+            mss_mon = self._screen_to_mss_coords(mon)
+            try:
+                bf = await self._run_in_thread(sct.grab, mss_mon)
+            except Exception as e:
+                if self.debug:
+                    log.error(f"Failed to capture before frame: {e}")
+                return
 
-                # Only log significant scroll movements
-                scroll_magnitude = (dx**2 + dy**2) ** 0.5
-                if scroll_magnitude < 1.0:  # Very small scrolls
-                    if self.debug:
-                        log.info(f"Scroll too small: magnitude={scroll_magnitude:.2f}")
-                    return
+            # Only log significant scroll movements
+            scroll_magnitude = (dx**2 + dy**2) ** 0.5
+            if scroll_magnitude < 1.0:  # Very small scrolls
+                if self.debug:
+                    log.info(f"Scroll too small: magnitude={scroll_magnitude:.2f}")
+                return
 
-                log.info(
-                    f"Scroll @({rel_x:7.1f},{rel_y:7.1f}) dx={dx:.2f} dy={dy:.2f} → win={idx}"
-                )
+            log.info(
+                f"Scroll @({rel_x:7.1f},{rel_y:7.1f}) dx={dx:.2f} dy={dy:.2f} → win={idx}"
+            )
 
-                if self._skip():
-                    return
+            if self._skip():
+                return
 
-                # Update activity timestamp
-                await self._update_activity_time()
+            # Update activity timestamp
+            await self._update_activity_time()
 
-                self._pending_event = {
-                    "type": "scroll",
-                    "position": (rel_x, rel_y),
-                    "mon": idx,
-                    "before": bf,
-                    "scroll": (dx, dy),
-                    "monitor_rect": mon,
-                }
+            self._pending_event = {
+                "type": "scroll",
+                "position": (rel_x, rel_y),
+                "mon": idx,
+                "before": bf,
+                "scroll": (dx, dy),
+                "monitor_rect": mon,
+            }
 
-                # Process event immediately
-                await flush()
+            # Process event immediately
+            await flush()
 
-            # Connect the handler functions to the instance variables
-            # so the pynput callbacks can invoke them
-            self._mouse_handler = _handle_mouse_event
-            self._scroll_handler = _handle_scroll_event
-            self._key_handler = _handle_key_event
+        # Connect the handler functions to the instance variables
+        # so the pynput callbacks can invoke them
+        self._mouse_handler = _handle_mouse_event
+        self._scroll_handler = _handle_scroll_event
+        self._key_handler = _handle_key_event
+        if self._dispatch_task is None:
+            self._dispatch_task = asyncio.create_task(self._dispatch_events())
 
-            # ---- main capture loop ----
-            log.info(f"Screen observer started — guarding {self._guard or '∅'}")
-            last_periodic = time.time()
-            last_screenshot_cleanup = time.time()
-            frame_count = 0
+        # ---- main capture loop ----
+        log.info(f"Screen observer started — guarding {self._guard or '∅'}")
+        last_periodic = time.monotonic()
+        last_screenshot_cleanup = time.monotonic()
+        frame_count = 0
 
-            # Initialize last activity time
-            async with self._inactivity_lock:
-                self._last_activity_time = time.time()
+        # Initialize last activity time
+        async with self._inactivity_lock:
+            self._last_activity_time = time.time()
 
-            while self._running:  # flag from base class
-                t0 = time.time()
+        while self._running:  # flag from base class
+            t0 = time.monotonic()
 
-                # Check for inactivity timeout
-                async with self._inactivity_lock:
-                    if self._last_activity_time is not None:
-                        inactive_duration = t0 - self._last_activity_time
-                        if inactive_duration >= self._inactivity_timeout:
-                            log.info(
-                                "Stopping recording due to %.1f minutes of inactivity",
-                                inactive_duration / 60,
-                            )
-                            banner = "=" * 70
-                            log.info(banner)
-                            log.info(
-                                "Recording automatically stopped after %.1f minutes of inactivity",
-                                inactive_duration / 60,
-                            )
-                            log.info(banner)
-                            self._running = False
-                            # Stop listeners to exit the main thread
-                            self.stop_listeners_sync()
-                            break
-
-                # For tracked windows, update regions periodically
-                # We capture frames at event time (not periodic)
-                if self._tracked_windows:
-                    any_window_open = await self._update_tracked_regions()
-
-                    # Stop recording if all tracked windows are closed
-                    if not any_window_open:
-                        log.info("All tracked windows closed - stopping recording")
+            # Check for inactivity timeout
+            async with self._inactivity_lock:
+                if self._last_activity_time is not None:
+                    inactive_duration = time.time() - self._last_activity_time
+                    if inactive_duration >= self._inactivity_timeout:
+                        log.info(
+                            "Stopping recording due to %.1f minutes of inactivity",
+                            inactive_duration / 60,
+                        )
                         banner = "=" * 70
                         log.info(banner)
-                        log.info("All tracked windows have been closed")
+                        log.info(
+                            "Recording automatically stopped after %.1f minutes of inactivity",
+                            inactive_duration / 60,
+                        )
                         log.info(banner)
+                        self._running = False
                         # Stop listeners to exit the main thread
                         self.stop_listeners_sync()
-                        self._running = False
                         break
 
-                    if (
-                        self.debug and frame_count % 30 == 0
-                    ):  # Log every 30 frames to avoid spam
-                        log.info(f"Updated tracked window regions")
-                    frame_count += 1
-
-                    # Force garbage collection periodically to prevent memory buildup
-                    if frame_count % self._MEMORY_CLEANUP_INTERVAL == 0:
-                        await self._run_in_thread(gc.collect)
-
-                # Clean up old screenshots every 5 minutes
-                if t0 - last_screenshot_cleanup > 300:  # 300 seconds = 5 minutes
-                    await self._cleanup_old_screenshots()
-                    last_screenshot_cleanup = t0
+            # For tracked windows, update regions periodically
+            # We capture frames at event time (not periodic)
+            if self._tracked_windows:
+                any_window_open = await self._update_tracked_regions(refresh=True)
+
+                # Stop recording if all tracked windows are closed
+                if not any_window_open:
+                    log.info("All tracked windows closed - stopping recording")
+                    banner = "=" * 70
+                    log.info(banner)
+                    log.info("All tracked windows have been closed")
+                    log.info(banner)
+                    # Stop listeners to exit the main thread
+                    self.stop_listeners_sync()
+                    self._running = False
+                    break
 
-                # Check for keyboard session timeout
-                current_time = time.time()
                 if (
-                    self._key_activity_start is not None
-                    and current_time - self._key_activity_start
-                    > self._key_activity_timeout
-                    and len(self._key_screenshots) > 1
-                ):
-                    # Session ended - rename last screenshot to indicate it's the final one
-                    async with self._key_activity_lock:
-                        if len(self._key_screenshots) > 1:
-                            last_path = self._key_screenshots[-1]
-                            final_path = last_path.replace("_intermediate", "_final")
-                            try:
-                                await self._run_in_thread(
-                                    os.rename, last_path, final_path
-                                )
-                                self._key_screenshots[-1] = final_path
-                                log.info(
-                                    f"Keyboard session ended, renamed final screenshot: {final_path}"
-                                )
-                            except OSError:
-                                pass
-                        self._key_activity_start = None
-                        self._key_screenshots = []
-
-                # fps throttle
-                dt = time.time() - t0
-                await asyncio.sleep(max(0, (1 / CAP_FPS) - dt))
-
-            # Shutdown listeners if started in async worker
-            # (main thread listeners are stopped via stop_listeners_sync)
-            if not self._start_listeners_on_main_thread:
-                mouse_listener.stop()
-                key_listener.stop()
-
-            # Final cleanup of any remaining keyboard session
-            if self._key_activity_start is not None and len(self._key_screenshots) > 1:
+                    self.debug and frame_count % 30 == 0
+                ):  # Log every 30 frames to avoid spam
+                    log.info(f"Updated tracked window regions")
+                frame_count += 1
+
+            # Clean up old screenshots every 5 minutes
+            if t0 - last_screenshot_cleanup > 300:  # 300 seconds = 5 minutes
+                await self._cleanup_old_screenshots()
+                last_screenshot_cleanup = t0
+
+            # Check for keyboard session timeout
+            current_time = time.monotonic()
+            if (
+                self._key_activity_start is not None
+                and current_time - self._key_activity_start
+                > self._key_activity_timeout
+                and self._key_screenshot_count > 1
+            ):
+                # Session ended - rename last screenshot to indicate it's the final one
                 async with self._key_activity_lock:
-                    last_path = self._key_screenshots[-1]
-                    final_path = last_path.replace("_intermediate", "_final")
-                    try:
-                        await self._run_in_thread(os.rename, last_path, final_path)
-                        log.info(
-                            f"Final keyboard session cleanup, renamed: {final_path}"
-                        )
-                    except OSError:
-                        pass
-                    await self._cleanup_key_screenshots()
+                    if self._key_screenshot_count > 1:
+                        last_path = self._key_last_path
+                        final_path = last_path.replace("_intermediate", "_final")
+                        # The last screenshot may still be waiting to be written
+                        await self._wait_written(last_path)
+                        try:
+                            await self._run_in_thread(
+                                os.rename, last_path, final_path
+                            )
+                            self._key_last_path = final_path
+                            log.info(
+                                f"Keyboard session ended, renamed final screenshot: {final_path}"
+                            )
+                        except OSError:
+                            pass
+                    self._key_activity_start = None
+                    self._key_last_path = None
+                    self._key_screenshot_count = 0
+
+            # fps throttle
+            dt = time.monotonic() - t0
+            await asyncio.sleep(max(0, (1 / CAP_FPS) - dt))
+
+        # Shutdown listeners if started in async worker
+        # (main thread listeners are stopped via stop_listeners_sync)
+        if not self._start_listeners_on_main_thread:
+            mouse_listener.stop()
+            key_listener.stop()
+
+        # Final cleanup of any remaining keyboard session
+        if self._key_activity_start is not None and self._key_screenshot_count > 1:
+            async with self._key_activity_lock:
+                last_path = self._key_last_path
+                # The last screenshot may still be waiting to be written
+                await self._wait_written(last_path)
+                final_path = last_path.replace("_intermediate", "_final")
+                try:
+                    await self._run_in_thread(os.rename, last_path, final_path)
+                    log.info(
+                        f"Final keyboard session cleanup, renamed: {final_path}"
+                    )
+                except OSError:
+                    pass
+                await self._cleanup_key_screenshots()